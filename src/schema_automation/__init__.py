@@ -1,5 +1,16 @@
 """Paquete principal para la automatización de schemas de Naranja X."""
 
-from .service.workflow import build_schema_from_url, generate_schema
+from __future__ import annotations
 
-__all__ = ["build_schema_from_url", "generate_schema"]
+from typing import Any
+
+__all__ = ["build_schema_from_url", "build_schemas_from_urls", "generate_schema"]
+
+
+def __getattr__(name: str) -> Any:
+    # Import diferido: evita cargar requests/bs4/selectolax al importar el paquete.
+    if name in __all__:
+        from .service import workflow
+
+        return getattr(workflow, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,19 +3,18 @@
 from __future__ import annotations
 
 import argparse
-import json
 import sys
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
-from .service.workflow import generate_schema
+import orjson
 
 
 def _parse_key_value_pairs(values: list[str]) -> Dict[str, Any]:
     result: Dict[str, Any] = {}
     for item in values:
-        if "=" not in item:
+        key, sep, value = item.partition("=")
+        if not sep:
             raise argparse.ArgumentTypeError(f"El parámetro '{item}' debe tener formato clave=valor")
-        key, value = item.split("=", 1)
         result[key] = value
     return result
 
@@ -55,16 +54,64 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+_FAST_FLAGS = {"--script": "script", "--schema-only": "schema_only"}
+_FAST_VALUES = {
+    "--schema-type": "schema_type",
+    "--offer-catalog": "offer_catalog_key",
+    "--set": "overrides",
+}
+
+
+def _fast_parse_args(argv: List[str]) -> Optional[argparse.Namespace]:
+    """Parsea invocaciones simples sin construir argparse; None si no aplica."""
+    values: Dict[str, Any] = {
+        "schema_type": "payment_card",
+        "offer_catalog_key": None,
+        "overrides": [],
+        "script": False,
+        "schema_only": False,
+    }
+    positionals: List[str] = []
+    tokens = iter(argv)
+    for token in tokens:
+        if not token.startswith("-"):
+            positionals.append(token)
+            continue
+        name, sep, value = token.partition("=")
+        if not sep and name in _FAST_FLAGS:
+            values[_FAST_FLAGS[name]] = True
+            continue
+        dest = _FAST_VALUES.get(name)
+        if dest is None:
+            return None
+        if not sep:
+            value = next(tokens, None)
+            if value is None or value.startswith("-"):
+                return None
+        if dest == "overrides":
+            values["overrides"].append(value)
+        else:
+            values[dest] = value
+    if len(positionals) != 2:
+        return None
+    return argparse.Namespace(url=positionals[0], nombre=positionals[1], **values)
+
+
 def main(argv: list[str] | None = None) -> int:
-    parser = build_parser()
-    args = parser.parse_args(argv)
+    parser: Optional[argparse.ArgumentParser] = None
+    args = _fast_parse_args(sys.argv[1:] if argv is None else argv)
+    if args is None:
+        parser = build_parser()
+        args = parser.parse_args(argv)
 
     try:
         overrides = _parse_key_value_pairs(args.overrides)
     except argparse.ArgumentTypeError as exc:
-        parser.error(str(exc))
+        (parser or build_parser()).error(str(exc))
         return 2
 
+    from .service.workflow import generate_schema
+
     kwargs: Dict[str, Any] = {"as_script": args.script, "schema_only": args.schema_only}
     kwargs.update(overrides)
     if args.offer_catalog_key:
@@ -80,8 +127,18 @@ def main(argv: list[str] | None = None) -> int:
     if args.script:
         sys.stdout.write(result)
     else:
-        sys.stdout.write(json.dumps(result, ensure_ascii=False, indent=2))
-        sys.stdout.write("\n")
+        payload = orjson.dumps(
+            result,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS,
+        )
+        buffer = getattr(sys.stdout, "buffer", None)
+        if buffer is None:
+            # stdout reemplazado por un stream de texto (p. ej. redirect_stdout(StringIO())).
+            sys.stdout.write(payload.decode())
+        else:
+            sys.stdout.flush()
+            buffer.write(payload)
+            buffer.flush()
     return 0
 
 
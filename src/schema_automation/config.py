@@ -3,31 +3,58 @@
 from __future__ import annotations
 
 from datetime import date, timedelta
-from typing import Dict, List
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping, Tuple
+
+
+def _freeze(value: Any) -> Any:
+    """Convierte dicts/listas anidados en `MappingProxyType`/tuplas de solo lectura."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Devuelve una copia mutable (dicts/listas) de un valor JSON, congelado o no."""
+    cls = value.__class__
+    if cls is dict or cls is MappingProxyType:
+        return {key: thaw(item) for key, item in value.items()}
+    if cls is list or cls is tuple:
+        return [thaw(item) for item in value]
+    return value
+
 
 # Fechas y rating por defecto -------------------------------------------------
 
 DEFAULT_PRICE_VALIDITY_DAYS = 365
 
 
+@lru_cache(maxsize=16)
+def _iso_days_after(ordinal: int, days: int) -> str:
+    return (date.fromordinal(ordinal) + timedelta(days=days)).isoformat()
+
+
 def default_price_valid_until(days: int = DEFAULT_PRICE_VALIDITY_DAYS) -> str:
     """Devuelve una fecha ISO usada como `priceValidUntil` por defecto."""
-    return (date.today() + timedelta(days=days)).isoformat()
+    return _iso_days_after(date.today().toordinal(), days)
 
 
-DEFAULT_AGG_RATING = {
+DEFAULT_AGG_RATING: Mapping[str, Any] = _freeze({
     "@type": "AggregateRating",
     "ratingValue": 4.6,
     "ratingCount": 991000,
     "bestRating": 5,
     "worstRating": 1,
-}
+})
 
 DEFAULT_LANGUAGE = "es-AR"
 
 # Organizaciones y direcciones -------------------------------------------------
 
-ORGANIZATIONS: Dict[str, Dict[str, object]] = {
+ORGANIZATIONS: Mapping[str, Mapping[str, Any]] = _freeze({
     "tarjeta_naranja": {
         "@type": "Organization",
         "@id": "https://www.naranjax.com/#OrgTarjetaNaranja",
@@ -85,9 +112,9 @@ ORGANIZATIONS: Dict[str, Dict[str, object]] = {
             "value": "30-68537634-9",
         },
     },
-}
+})
 
-NARANJA_X_ADDRESSES: List[Dict[str, object]] = [
+NARANJA_X_ADDRESSES: Tuple[Mapping[str, Any], ...] = _freeze([
     {
         "@type": "PostalAddress",
         "name": "Casa Naranja",
@@ -106,9 +133,9 @@ NARANJA_X_ADDRESSES: List[Dict[str, object]] = [
         "postalCode": "C1427BQA",
         "addressCountry": "AR",
     },
-]
+])
 
-WEBPAGE_DEFAULTS = {
+WEBPAGE_DEFAULTS: Mapping[str, Any] = _freeze({
     "@type": "WebPage",
     "inLanguage": DEFAULT_LANGUAGE,
     "isPartOf": {
@@ -116,17 +143,17 @@ WEBPAGE_DEFAULTS = {
         "@id": "https://www.naranjax.com/#website",
     },
     "publisher": {"@id": ORGANIZATIONS["tarjeta_naranja"]["@id"]},
-}
+})
 
 # Defaults de productos -------------------------------------------------------
 
-PRICE_SPEC_DEFAULT = {
+PRICE_SPEC_DEFAULT: Mapping[str, Any] = _freeze({
     "TNA": {"min": 55, "max": 153},
     "TEA": {"min": 71.22, "max": 322.08},
     "CFTEA": {"min": 91.11, "max": 459.39},
-}
+})
 
-PAYMENT_SERVICE_DEFAULTS = {
+PAYMENT_SERVICE_DEFAULTS: Mapping[str, Any] = _freeze({
     "area_served": {"@type": "Country", "name": "Argentina"},
     "provider": {
         "org_key": "naranja_x",
@@ -135,9 +162,9 @@ PAYMENT_SERVICE_DEFAULTS = {
         "price_currency": "ARS",
         "eligible_region": "AR",
     },
-}
+})
 
-INSURANCE_AGENCY_DEFAULTS = {
+INSURANCE_AGENCY_DEFAULTS: Mapping[str, Any] = _freeze({
     "agency": {
         "id_suffix": "#insurance-agency",
         "area_served": {"@type": "AdministrativeArea", "name": "Argentina"},
@@ -165,15 +192,15 @@ INSURANCE_AGENCY_DEFAULTS = {
         "area_served": "AR",
         "eligible_region": "AR",
     },
-}
+})
 
-FINANCIAL_PRODUCT_ZERO_RATES = {
+FINANCIAL_PRODUCT_ZERO_RATES: Mapping[str, Any] = _freeze({
     "TNA": 0,
     "TEA": 0,
     "CFT": 0,
-}
+})
 
-LOAN_OR_CREDIT_DEFAULTS = {
+LOAN_OR_CREDIT_DEFAULTS: Mapping[str, Any] = _freeze({
     "amount": {
         "currency": "ARS",
         "minValue": 10000,
@@ -200,9 +227,9 @@ LOAN_OR_CREDIT_DEFAULTS = {
         "name": "Sistema de amortización francés",
         "description": "Cuotas fijas mensuales con interés fijo durante todo el plazo (método francés).",
     },
-}
+})
 
-FINANCIAL_PRODUCT_DEFAULTS = {
+FINANCIAL_PRODUCT_DEFAULTS: Mapping[str, Any] = _freeze({
     "area_served": "AR",
     "provider": {
         "org_key": "tarjeta_naranja",
@@ -220,9 +247,9 @@ FINANCIAL_PRODUCT_DEFAULTS = {
         "id_suffix": "#financial-product",
     },
     "faq_id_suffix": "#FAQPage",
-}
+})
 
-INVESTMENT_OR_DEPOSIT_DEFAULTS = {
+INVESTMENT_OR_DEPOSIT_DEFAULTS: Mapping[str, Any] = _freeze({
     "area_served": "AR",
     "globals": {
         "duration": "",
@@ -266,11 +293,11 @@ INVESTMENT_OR_DEPOSIT_DEFAULTS = {
         "id_suffix": "#product",
     },
     "faq_id_suffix": "#FAQPage",
-}
+})
 
 # Catálogos -------------------------------------------------------------------
 
-OFFER_CATALOGS: Dict[str, Dict[str, object]] = {
+OFFER_CATALOGS: Mapping[str, Mapping[str, Any]] = _freeze({
     "prestamos": {
         "name": "Catálogo de Préstamos",
         "items": [
@@ -351,4 +378,4 @@ OFFER_CATALOGS: Dict[str, Dict[str, object]] = {
             },
         ],
     },
-}
+})
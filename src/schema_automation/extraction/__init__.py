@@ -1,5 +1,6 @@
 """Utilidades de extracción de contenido desde HTML."""
 
+from .html import parse_tree_once
 from .meta import extract_basic_meta
 from .text import extract_flat_text
 from .faqs import extract_faqs, extract_faqs_from_nx_accordion, extract_faqs_fallback
@@ -10,4 +11,5 @@ __all__ = [
     "extract_faqs",
     "extract_faqs_from_nx_accordion",
     "extract_faqs_fallback",
+    "parse_tree_once",
 ]
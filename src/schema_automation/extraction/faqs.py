@@ -2,71 +2,98 @@
 
 from __future__ import annotations
 
-import re
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
-from bs4 import BeautifulSoup, Tag
+from selectolax.lexbor import LexborNode
 
-from .html import ensure_soup
-from .text import clean_text
+from .html import ensure_tree
+from .text import node_text
 
-QUESTION_RE = re.compile(r"¿.+\?$")
+_SEL_ROOT = "accordion-list ul.accordion-list"
+_SEL_Q1 = "h3.accordion-label"
+_SEL_Q2 = ".accordion__projected-title h3"
+_SEL_BODY = ".accordion__body, .accordion__body-container"
+_SEL_HEADING = ".accordion__heading"
+_SEL_P = "p"
+_SEL_LIST = "ul, ol"
+_SEL_FALLBACK = "h3,button"
 
+_NON_ELEMENT_TAGS = frozenset({"-text", "-comment"})
 
-def _extract_answer_text(body: Tag) -> str:
+
+def _select(node: LexborNode, selector: str) -> Iterator[LexborNode]:
+    """Descendientes que cumplen el selector (lexbor incluye al propio nodo)."""
+    return (match for match in node.css(selector) if match != node)
+
+
+def _select_one(node: LexborNode, selector: str) -> Optional[LexborNode]:
+    return next(_select(node, selector), None)
+
+
+def _child_items(node: LexborNode) -> Iterator[LexborNode]:
+    """Hijos directos `<li>` del nodo."""
+    return (child for child in node.iter() if child.tag == "li")
+
+
+def _next_element(node: LexborNode) -> Optional[LexborNode]:
+    sibling = node.next
+    while sibling is not None and sibling.tag in _NON_ELEMENT_TAGS:
+        sibling = sibling.next
+    return sibling
+
+
+def _extract_answer_text(body: LexborNode) -> str:
     """Convierte el contenido del panel a texto plano legible."""
-    chunks: List[str] = []
+    buf: List[str] = []
 
-    for paragraph in body.select("p"):
-        txt = clean_text(paragraph.get_text(" ", strip=True))
+    for paragraph in _select(body, _SEL_P):
+        txt = node_text(paragraph)
         if txt:
-            chunks.append(txt)
+            buf.append(txt)
+            buf.append("\n\n")
 
-    for lst in body.select("ul, ol"):
-        items = []
-        for li in lst.select(":scope > li"):
-            li_txt = clean_text(li.get_text(" ", strip=True))
+    for lst in _select(body, _SEL_LIST):
+        first = True
+        for li in _child_items(lst):
+            li_txt = node_text(li)
             if li_txt:
-                items.append(f"• {li_txt}")
-        if items:
-            chunks.append("\n".join(items))
+                buf.append("• " if first else "\n• ")
+                buf.append(li_txt)
+                first = False
+        if not first:
+            buf.append("\n\n")
 
-    if not chunks:
-        raw = clean_text(body.get_text(" ", strip=True))
-        if raw:
-            chunks.append(raw)
+    if not buf:
+        return node_text(body)
 
-    return "\n\n".join(chunks).strip()
+    return "".join(buf).rstrip()
 
 
-def extract_faqs_from_nx_accordion(html_or_soup) -> List[Dict[str, str]]:
+def extract_faqs_from_nx_accordion(html_or_tree) -> List[Dict[str, str]]:
     """Extrae FAQs del componente `accordion-list` usado en Naranja X."""
-    soup = ensure_soup(html_or_soup)
+    tree = ensure_tree(html_or_tree)
     faqs: List[Dict[str, str]] = []
+    seen: Set[Tuple[str, str]] = set()
 
-    roots = soup.select("accordion-list ul.accordion-list")
+    roots = tree.css(_SEL_ROOT)
     if not roots:
         return faqs
 
     for root in roots:
-        for li in root.select(":scope > li"):
-            question_node = li.select_one("h3.accordion-label")
+        for li in _child_items(root):
+            question_node = _select_one(li, _SEL_Q1)
             if question_node is None:
-                question_node = li.select_one(".accordion__projected-title h3")
+                question_node = _select_one(li, _SEL_Q2)
             if question_node is None:
                 continue
 
-            question = clean_text(question_node.get_text(" ", strip=True))
-            if question and QUESTION_RE.search(question) is None:
-                question = question or ""
+            question = node_text(question_node)
 
-            body = li.select_one(".accordion__body, .accordion__body-container")
+            body = _select_one(li, _SEL_BODY)
             if body is None:
-                heading = li.select_one(".accordion__heading")
-                if heading:
-                    sibling = heading.find_next_sibling()
-                    if isinstance(sibling, Tag):
-                        body = sibling
+                heading = _select_one(li, _SEL_HEADING)
+                if heading is not None:
+                    body = _next_element(heading)
             if body is None:
                 continue
 
@@ -74,46 +101,40 @@ def extract_faqs_from_nx_accordion(html_or_soup) -> List[Dict[str, str]]:
             if not answer:
                 continue
 
+            key = (question, answer)
+            if key in seen:
+                continue
+            seen.add(key)
             faqs.append({"question": question, "answer": answer})
 
-    seen = set()
-    unique: List[Dict[str, str]] = []
-    for faq in faqs:
-        key = (faq["question"], faq["answer"])
-        if key not in seen:
-            seen.add(key)
-            unique.append(faq)
-    return unique
+    return faqs
 
 
-def extract_faqs_fallback(html_or_soup) -> List[Dict[str, str]]:
+def extract_faqs_fallback(html_or_tree) -> List[Dict[str, str]]:
     """Heurística genérica basada en headings/botones con signo de pregunta."""
-    soup = ensure_soup(html_or_soup)
+    tree = ensure_tree(html_or_tree)
     faqs: List[Dict[str, str]] = []
-    for node in soup.select("h3,button"):
-        question = clean_text(node.get_text(" ", strip=True))
+    seen: Set[Tuple[str, str]] = set()
+    for node in tree.css(_SEL_FALLBACK):
+        question = node_text(node)
         if not question or "?" not in question:
             continue
-        sibling = node.find_next_sibling()
-        answer = ""
-        if isinstance(sibling, Tag):
-            answer = clean_text(sibling.get_text(" ", strip=True))
-        if question and answer:
-            faqs.append({"question": question, "answer": answer})
+        sibling = _next_element(node)
+        answer = node_text(sibling) if sibling is not None else ""
+        if not answer:
+            continue
+        key = (question, answer)
+        if key in seen:
+            continue
+        seen.add(key)
+        faqs.append({"question": question, "answer": answer})
 
-    seen = set()
-    unique: List[Dict[str, str]] = []
-    for faq in faqs:
-        key = (faq["question"], faq["answer"])
-        if key not in seen:
-            seen.add(key)
-            unique.append(faq)
-    return unique
+    return faqs
 
 
-def extract_faqs(html_or_soup) -> List[Dict[str, str]]:
+def extract_faqs(html_or_tree) -> List[Dict[str, str]]:
     """Ejecuta extracción específica y fallback combinados."""
-    faqs = extract_faqs_from_nx_accordion(html_or_soup)
+    faqs = extract_faqs_from_nx_accordion(html_or_tree)
     if faqs:
         return faqs
-    return extract_faqs_fallback(html_or_soup)
+    return extract_faqs_fallback(html_or_tree)
@@ -1,14 +1,43 @@
-"""Helpers para trabajar con BeautifulSoup."""
+"""Helpers para obtener árboles HTML (selectolax y BeautifulSoup)."""
 
 from __future__ import annotations
 
-from typing import Union
+from functools import lru_cache
+from typing import TYPE_CHECKING, Union
 
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
+
+def ensure_tree(html_or_tree: Union[str, LexborHTMLParser, BeautifulSoup]) -> LexborHTMLParser:
+    """Retorna un árbol selectolax (lexbor) independientemente del input."""
+    if isinstance(html_or_tree, LexborHTMLParser):
+        return html_or_tree
+    if not isinstance(html_or_tree, str):
+        # Compatibilidad con quienes todavía pasan un BeautifulSoup.
+        html_or_tree = str(html_or_tree)
+    return LexborHTMLParser(html_or_tree)
 
 
 def ensure_soup(html_or_soup: Union[str, BeautifulSoup]) -> BeautifulSoup:
-    """Retorna una instancia de BeautifulSoup independientemente del input."""
+    """Retorna una instancia de BeautifulSoup independientemente del input.
+
+    Shim de compatibilidad para código externo: ningún paso del flujo principal lo usa.
+    """
+    # Import diferido: el flujo principal trabaja solo con selectolax.
+    from bs4 import BeautifulSoup
+
     if isinstance(html_or_soup, BeautifulSoup):
         return html_or_soup
     return BeautifulSoup(html_or_soup, "lxml")
+
+
+@lru_cache(maxsize=4)
+def parse_tree_once(html: str) -> LexborHTMLParser:
+    """Parsea el HTML con selectolax una sola vez por contenido.
+
+    El resultado se comparte entre llamadas, por lo que no debe mutarse.
+    """
+    return ensure_tree(html)
@@ -2,42 +2,50 @@
 
 from __future__ import annotations
 
-from typing import Dict, Optional
+from typing import Dict, FrozenSet, Optional, Tuple
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 
-from .html import ensure_soup
+from .html import ensure_tree
+
+_WANTED_META: FrozenSet[Tuple[str, str]] = frozenset(
+    {
+        ("name", "description"),
+        ("property", "og:description"),
+        ("property", "og:title"),
+        ("property", "og:image"),
+    }
+)
 
 
 def extract_basic_meta(
     html: str,
     *,
     base_url: Optional[str] = None,
-    soup: Optional[BeautifulSoup] = None,
+    tree: Optional[LexborHTMLParser] = None,
 ) -> Dict[str, str]:
     """Obtiene título, descripción e imagen preferida de la página."""
-    soup = soup or ensure_soup(html)
-
-    def meta(name: Optional[str] = None, prop: Optional[str] = None) -> str:
-        if name:
-            tag = soup.find("meta", attrs={"name": name})
-        elif prop:
-            tag = soup.find("meta", attrs={"property": prop})
-        else:
-            tag = None
-        if tag is None:
-            return ""
-        content = tag.get("content")
-        return content.strip() if content else ""
-
-    title = soup.title.string.strip() if soup.title and soup.title.string else ""
-    og_title = meta(prop="og:title")
+    tree = tree or ensure_tree(html)
+
+    found: Dict[Tuple[str, str], str] = {}
+    for tag in tree.css("meta"):
+        attrs = tag.attributes
+        for attr in ("name", "property"):
+            key = (attr, attrs.get(attr))
+            if key in _WANTED_META and key not in found:
+                content = attrs.get("content")
+                found[key] = content.strip() if content else ""
+
+    title_node = tree.css_first("title")
+    title_text = title_node.text() if title_node is not None else ""
+    title = title_text.strip() if title_text else ""
+    og_title = found.get(("property", "og:title"), "")
     if og_title:
         title = og_title
 
-    description = meta(name="description") or meta(prop="og:description")
-    image = meta(prop="og:image")
+    description = found.get(("name", "description"), "") or found.get(("property", "og:description"), "")
+    image = found.get(("property", "og:image"), "")
 
     if base_url and image:
         image = urljoin(base_url, image)
@@ -2,36 +2,78 @@
 
 from __future__ import annotations
 
-import re
 import unicodedata
-from typing import Optional
+from typing import FrozenSet, Iterator, List, Optional
 
-from bs4 import Tag
+from selectolax.lexbor import LexborNode
 
-WHITESPACE_RE = re.compile(r"\s+")
+_INVISIBLE_TRANS = str.maketrans({"\xa0": " ", "\u200b": None})
+
+_KILL_SET = frozenset(
+    {
+        "script",
+        "style",
+        "noscript",
+        "template",
+        "svg",
+        "canvas",
+        "iframe",
+        "form",
+        "button",
+        "select",
+        "input",
+        "textarea",
+        "header",
+        "footer",
+        "nav",
+        "-comment",
+    }
+)
 
 
 def clean_text(value: str) -> str:
     """Normaliza espacios y caracteres invisibles en un string."""
-    normalized = unicodedata.normalize("NFKC", value or "")
-    normalized = normalized.replace("\xa0", " ").replace("\u200b", "")
-    normalized = WHITESPACE_RE.sub(" ", normalized)
-    return normalized.strip()
+    normalized = value or ""
+    if not normalized.isascii():
+        normalized = unicodedata.normalize("NFKC", normalized).translate(_INVISIBLE_TRANS)
+    return " ".join(normalized.split())
+
+
+def _walk(node: LexborNode, out: List[str], kill: FrozenSet[str]) -> None:
+    # Pila explícita de iteradores: el HTML real puede anidar más niveles que el límite de recursión.
+    stack: List[Iterator[LexborNode]] = [node.iter(include_text=True)]
+    while stack:
+        child = next(stack[-1], None)
+        if child is None:
+            stack.pop()
+            continue
+        tag = child.tag
+        if tag == "-text":
+            out.append(child.text_content)
+        elif tag in kill:
+            continue
+        elif tag in ("br", "hr"):
+            out.append(" ")
+        else:
+            stack.append(child.iter(include_text=True))
+
+
+# Lo que `get_text()` de BeautifulSoup no considera texto.
+_NON_TEXT_SET = frozenset({"script", "style", "-comment"})
 
 
-def extract_flat_text(body: Optional[Tag]) -> str:
+def node_text(node: LexborNode) -> str:
+    """Texto limpio de un nodo; equivale a `clean_text(tag.get_text(" ", strip=True))`."""
+    buf: List[str] = []
+    _walk(node, buf, _NON_TEXT_SET)
+    return clean_text(" ".join(buf))
+
+
+def extract_flat_text(body: Optional[LexborNode]) -> str:
     """Devuelve el texto de un nodo HTML en una sola línea limpia."""
     if body is None:
         return ""
 
-    kill = (
-        "script,style,noscript,template,svg,canvas,iframe,"
-        "form,button,select,input,textarea,header,footer,nav"
-    )
-    for el in body.select(kill):
-        el.decompose()
-
-    for br in body.find_all(["br", "hr"]):
-        br.replace_with(" ")
-
-    return clean_text(body.get_text(" ", strip=True))
+    buf: List[str] = []
+    _walk(body, buf, _KILL_SET)
+    return clean_text(" ".join(buf))
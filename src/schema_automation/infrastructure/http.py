@@ -3,9 +3,14 @@
 from __future__ import annotations
 
 import logging
-from typing import Tuple
+import threading
+from threading import Lock
+from typing import Dict, Tuple
 
 import requests
+from cachetools import LRUCache, TTLCache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from w3lib.html import get_base_url
 
 logger = logging.getLogger(__name__)
@@ -14,13 +19,91 @@ DEFAULT_HEADERS = {
     "User-Agent": "Mozilla/5.0 (compatible; SchemaAutomation/1.0)",
 }
 
+FETCH_CACHE_TTL = 3600
+
+# `requests.Session` no es thread-safe: cada hilo (p. ej. los de `build_schemas_from_urls`) usa la suya.
+_LOCAL = threading.local()
+
+
+def _build_session() -> requests.Session:
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(total=2, backoff_factor=0.3),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _session() -> requests.Session:
+    session = getattr(_LOCAL, "session", None)
+    if session is None:
+        session = _LOCAL.session = _build_session()
+    return session
+
+# Validadores (ETag / Last-Modified) y último resultado por URL para GET condicionales.
+_VALIDATORS: LRUCache = LRUCache(maxsize=128)
+_VALIDATORS_LOCK = Lock()
+
+# Resultado de cada URL durante FETCH_CACHE_TTL; `refresh=True` o `clear_fetch_cache()` lo saltean.
+_FETCH_CACHE: TTLCache = TTLCache(maxsize=128, ttl=FETCH_CACHE_TTL)
+_FETCH_CACHE_LOCK = Lock()
+
+
+def clear_fetch_cache() -> None:
+    """Descarta las páginas cacheadas; la próxima llamada vuelve a la red."""
+    with _FETCH_CACHE_LOCK:
+        _FETCH_CACHE.clear()
+
+
+def fetch_html(url: str, timeout: int = 25, *, refresh: bool = False) -> Tuple[str, str, str]:
+    """Descarga el HTML de una página y devuelve (html, base_url, final_url).
+
+    El resultado se cachea por URL; con `refresh=True` se vuelve a pedir la página
+    (con GET condicional si hay validadores) y se reemplaza la entrada cacheada.
+    """
+    if not refresh:
+        with _FETCH_CACHE_LOCK:
+            cached_result = _FETCH_CACHE.get(url)
+        if cached_result is not None:
+            return cached_result
+
+    result = _download(url, timeout)
+    with _FETCH_CACHE_LOCK:
+        _FETCH_CACHE[url] = result
+    return result
+
+
+def _download(url: str, timeout: int) -> Tuple[str, str, str]:
+    with _VALIDATORS_LOCK:
+        previous = _VALIDATORS.get(url)
+
+    headers: Dict[str, str] = {}
+    if previous is not None:
+        etag, last_modified, _ = previous
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    response = _session().get(url, headers=headers, timeout=timeout)
+    if response.status_code == 304 and previous is not None:
+        logger.debug("Not modified %s", url)
+        return previous[2]
 
-def fetch_html(url: str, timeout: int = 25) -> Tuple[str, str, str]:
-    """Descarga el HTML de una página y devuelve (html, base_url, final_url)."""
-    response = requests.get(url, headers=DEFAULT_HEADERS, timeout=timeout)
     response.raise_for_status()
     html = response.text
     base_url = get_base_url(html, response.url)
     final_url = response.url
     logger.debug("Fetched %s (base=%s)", final_url, base_url)
-    return html, base_url, final_url
+
+    result = (html, base_url, final_url)
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if etag or last_modified:
+        with _VALIDATORS_LOCK:
+            _VALIDATORS[url] = (etag, last_modified, result)
+    return result
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import csv
 import json
 import logging
 from pathlib import Path
-from typing import Iterable
+from typing import BinaryIO, Iterable
 
-import pandas as pd
+import orjson
 
 from ..models import SchemaRecord
 
@@ -19,20 +20,27 @@ def _ensure_parent(path: Path) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
 
 
-def save_outputs(
-    record: SchemaRecord,
-    *,
-    csv_path: str = "extracciones.csv",
-    jsonl_path: str = "schemas.jsonl",
-) -> None:
-    """Guarda un registro en CSV y JSONL, acumulando resultados."""
-    csv_file = Path(csv_path)
-    jsonl_file = Path(jsonl_path)
+_JSONL_BUFFER_SIZE = 1 << 20
+
+# Como `json.dumps`, convierte a string las claves no-str (p. ej. enteros en overrides).
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+_SCRIPT_OPEN = b'<script type="application/ld+json">\n'
+_SCRIPT_CLOSE = b"\n</script>"
+
+_CSV_FIELDS = [
+    "url",
+    "name",
+    "title",
+    "description",
+    "image",
+    "faqs_count",
+    "faqs_json",
+]
 
-    _ensure_parent(csv_file)
-    _ensure_parent(jsonl_file)
 
-    row = {
+def _csv_row(record: SchemaRecord) -> dict:
+    return {
         "url": record.url,
         "name": record.name,
         "title": record.extracted.title,
@@ -42,28 +50,58 @@ def save_outputs(
         "faqs_json": json.dumps(record.extracted.faqs, ensure_ascii=False),
     }
 
-    try:
-        existing = pd.read_csv(csv_file)
-    except FileNotFoundError:
-        df = pd.DataFrame([row])
-    except pd.errors.EmptyDataError:
-        df = pd.DataFrame([row])
-    except Exception:
-        logger.exception("No se pudo leer %s", csv_file)
-        raise
-    else:
-        df = pd.concat([existing, pd.DataFrame([row])], ignore_index=True)
 
-    df.to_csv(csv_file, index=False)
+def save_outputs_many(
+    records: Iterable[SchemaRecord],
+    *,
+    csv_path: str = "extracciones.csv",
+    jsonl_path: str = "schemas.jsonl",
+) -> None:
+    """Guarda varios registros en CSV y JSONL abriendo cada archivo una sola vez."""
+    csv_file = Path(csv_path)
+    jsonl_file = Path(jsonl_path)
+
+    _ensure_parent(csv_file)
+    _ensure_parent(jsonl_file)
+
+    write_header = not csv_file.exists() or csv_file.stat().st_size == 0
+    with csv_file.open("a", encoding="utf-8", newline="") as csv_fh, open(
+        jsonl_file, "ab", buffering=_JSONL_BUFFER_SIZE
+    ) as jsonl_fh:
+        writer = csv.DictWriter(csv_fh, fieldnames=_CSV_FIELDS, lineterminator="\n")
+        if write_header:
+            writer.writeheader()
+        for record in records:
+            writer.writerow(_csv_row(record))
+            jsonl_fh.write(
+                orjson.dumps(
+                    {"url": record.url, "schema": record.schema},
+                    option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS,
+                )
+            )
+
+
+def save_outputs(
+    record: SchemaRecord,
+    *,
+    csv_path: str = "extracciones.csv",
+    jsonl_path: str = "schemas.jsonl",
+) -> None:
+    """Guarda un registro en CSV y JSONL, acumulando resultados."""
+    save_outputs_many([record], csv_path=csv_path, jsonl_path=jsonl_path)
 
-    with jsonl_file.open("a", encoding="utf-8") as fh:
-        fh.write(
-            json.dumps({"url": record.url, "schema": record.schema}, ensure_ascii=False)
-            + "\n"
-        )
+
+def as_script_tag_stream(obj: dict, fh: BinaryIO) -> None:
+    """Escribe la etiqueta <script> JSON-LD en `fh` sin armar el string completo."""
+    fh.write(_SCRIPT_OPEN)
+    fh.write(orjson.dumps(obj, option=_JSON_OPTIONS))
+    fh.write(_SCRIPT_CLOSE)
 
 
 def as_script_tag(obj: dict, *, indent: int = 2) -> str:
     """Serializa un grafo JSON-LD como etiqueta <script> lista para embeber."""
-    payload = json.dumps(obj, ensure_ascii=False, indent=indent)
-    return f'<script type="application/ld+json">\n{payload}\n</script>'
+    if indent == 2:
+        payload = orjson.dumps(obj, option=_JSON_OPTIONS)
+    else:
+        payload = json.dumps(obj, ensure_ascii=False, indent=indent).encode("utf-8")
+    return b"".join((_SCRIPT_OPEN, payload, _SCRIPT_CLOSE)).decode("utf-8")
@@ -7,6 +7,7 @@ from typing import Dict, List, Tuple
 
 import streamlit as st
 
+from ..infrastructure.http import FETCH_CACHE_TTL
 from ..service.workflow import generate_schema
 
 SCHEMA_OPTIONS: List[Tuple[str, str]] = [
@@ -37,15 +38,13 @@ DEFAULT_GENERATE_KWARGS: Dict[str, object] = {
     }
 }
 
-SCHEMA_LABEL_TO_KEY = {label: key for label, key in SCHEMA_OPTIONS}
-OFFER_LABEL_TO_KEY = {label: key for label, key in OFFER_CATALOG_OPTIONS}
+SCHEMA_LABEL_TO_KEY = dict(SCHEMA_OPTIONS)
+OFFER_LABEL_TO_KEY = dict(OFFER_CATALOG_OPTIONS)
+_SCHEMA_KEY_TO_INDEX = {key: idx for idx, (_, key) in enumerate(SCHEMA_OPTIONS)}
 
 
 def _schema_default_index(default_key: str) -> int:
-    for idx, (_, key) in enumerate(SCHEMA_OPTIONS):
-        if key == default_key:
-            return idx
-    return 0
+    return _SCHEMA_KEY_TO_INDEX.get(default_key, 0)
 
 
 def main() -> None:
@@ -79,6 +78,11 @@ def main() -> None:
             index=0,
             horizontal=True,
         )
+        refresh = st.checkbox(
+            "Volver a descargar la página",
+            help=f"Las páginas se cachean hasta {FETCH_CACHE_TTL // 60} minutos; "
+            "márcalo si la página cambió desde la última generación.",
+        )
         submitted = st.form_submit_button("Generar schema")
 
     if not submitted:
@@ -106,6 +110,7 @@ def main() -> None:
             nombre,
             schema_type=SCHEMA_LABEL_TO_KEY[schema_label],
             as_script=as_script,
+            refresh=refresh,
             **kwargs,
         )
     except Exception as exc:  # pragma: no cover - orientado a retro alimentacion visual
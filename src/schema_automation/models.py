@@ -14,6 +14,7 @@ class SchemaContext:
     image_url: Optional[str]
     faqs: List[Dict[str, str]]
     body_text: Optional[str]
+    # Se inserta por referencia en el grafo: tratarlo como inmutable.
     aggregate_rating: Optional[Dict[str, Any]]
 
 
@@ -4,8 +4,11 @@ from __future__ import annotations
 
 import re
 from copy import deepcopy
-from datetime import date, timedelta
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from dataclasses import dataclass
+from datetime import date
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 
 from ..config import (
     DEFAULT_LANGUAGE,
@@ -20,19 +23,58 @@ from ..config import (
     PRICE_SPEC_DEFAULT,
     WEBPAGE_DEFAULTS,
     default_price_valid_until,
+    thaw,
 )
 from ..models import SchemaContext
 
+_SLUG_RE = re.compile(r"[^0-9A-Za-z]+")
+_WORD_RE = re.compile(r"\w+")
 
-def deep_merge(base: Dict[str, Any], overrides: Optional[Dict[str, Any]]) -> Dict[str, Any]:
-    result = deepcopy(base)
+_AR_PLACE: Mapping[str, Any] = MappingProxyType(
+    {
+        "@type": "Place",
+        "name": "Argentina",
+        "address": MappingProxyType({"@type": "PostalAddress", "addressCountry": "AR"}),
+    }
+)
+
+# Default de solo lectura para `.get(...)`: evita crear un dict vacío por búsqueda fallida.
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+_ORG_KEY_BY_ID: Dict[str, str] = {org["@id"]: key for key, org in ORGANIZATIONS.items() if org.get("@id")}
+
+
+@lru_cache(maxsize=2)
+def _date_window_for(ordinal: int) -> Tuple[str, str]:
+    today = date.fromordinal(ordinal)
+    return today.isoformat(), date(today.year + 1, 12, 31).isoformat()
+
+
+def _date_window() -> Tuple[str, str]:
+    """Devuelve (hoy, 31/12 del año siguiente) en ISO, calculado una vez por día."""
+    return _date_window_for(date.today().toordinal())
+
+
+@lru_cache(maxsize=32)
+def _offset_iso(ordinal: int, offset: int) -> str:
+    """Fecha ISO `offset` días después del ordinal dado."""
+    return date.fromordinal(ordinal + offset).isoformat()
+
+
+def deep_merge(base: Mapping[str, Any], overrides: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    result = thaw(base)
     if not overrides:
         return result
-    for key, value in overrides.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = deep_merge(result[key], value)
-        else:
-            result[key] = deepcopy(value)
+    # `result` ya es una copia propia: se fusiona en sitio, sin volver a clonar niveles.
+    pending = [(result, overrides)]
+    while pending:
+        target, source = pending.pop()
+        for key, value in source.items():
+            current = target.get(key)
+            if current.__class__ is dict and value.__class__ is dict:
+                pending.append((current, value))
+            else:
+                target[key] = thaw(value)
     return result
 
 
@@ -43,17 +85,14 @@ def organization_reference(org_key_or_data: Any) -> Dict[str, str]:
 
 
 def resolve_organization(config: Optional[Dict[str, Any]], default_key: str) -> Dict[str, Any]:
-    cfg = config or {}
+    if not config:
+        return thaw(ORGANIZATIONS[default_key])
+    cfg = config
     org_key = cfg.get("org_key") or default_key
-    base = deepcopy(ORGANIZATIONS.get(org_key, ORGANIZATIONS[default_key]))
     org_id = cfg.get("id") or cfg.get("@id")
     if org_id:
-        matched = next(
-            (deepcopy(org) for org in ORGANIZATIONS.values() if org.get("@id") == org_id),
-            None,
-        )
-        if matched:
-            base = matched
+        org_key = _ORG_KEY_BY_ID.get(org_id, org_key)
+    base = thaw(ORGANIZATIONS.get(org_key, ORGANIZATIONS[default_key]))
     for key, value in cfg.items():
         if key in {"org_key", "overrides"}:
             continue
@@ -73,28 +112,28 @@ def resolve_organization(config: Optional[Dict[str, Any]], default_key: str) ->
 
 def append_organization(graph: List[Dict[str, Any]], org_data: Dict[str, Any], added_ids: set):
     org_id = org_data.get("@id")
-    if org_id and org_id in added_ids:
+    if not org_id:
+        graph.append(org_data)
         return
-    graph.append(org_data)
-    if org_id:
-        added_ids.add(org_id)
+    size = len(added_ids)
+    added_ids.add(org_id)
+    if len(added_ids) != size:
+        graph.append(org_data)
 
 
 def _faq_entities(faqs: List[Dict[str, str]]) -> List[Dict[str, Any]]:
-    entities: List[Dict[str, Any]] = []
-    for faq in faqs or []:
-        question = faq.get("question", "").strip()
-        answer = faq.get("answer", "").strip()
-        if not question or not answer:
-            continue
-        entities.append(
-            {
-                "@type": "Question",
-                "name": question,
-                "acceptedAnswer": {"@type": "Answer", "text": answer},
-            }
-        )
-    return entities
+    if not faqs:
+        return []
+    return [
+        {
+            "@type": "Question",
+            "name": question,
+            "acceptedAnswer": {"@type": "Answer", "text": answer},
+        }
+        for faq in faqs
+        for question, answer in ((faq.get("question", "").strip(), faq.get("answer", "").strip()),)
+        if question and answer
+    ]
 
 
 def build_faq_page(
@@ -131,7 +170,7 @@ def build_product_node(
     if image_url:
         node["image"] = image_url
     if aggregate_rating:
-        node["aggregateRating"] = deepcopy(aggregate_rating)
+        node["aggregateRating"] = aggregate_rating
     if description:
         node["description"] = description
     if extra:
@@ -140,18 +179,14 @@ def build_product_node(
 
 
 def build_offer_node(page_url: str, node_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
-    node: Dict[str, Any] = {"@type": "Offer", "@id": node_id, "url": data.get("url", page_url)}
-    for key, value in data.items():
-        if key == "url":
-            continue
-        node[key] = value
-    return node
+    return {"@type": "Offer", "@id": node_id, "url": page_url, **data}
 
 
 def build_webpage_node(ctx: SchemaContext, extra: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-    node = deepcopy(WEBPAGE_DEFAULTS)
-    node["@id"] = f"{ctx.page_url}#WebPage"
-    node["url"] = ctx.page_url
+    node = thaw(WEBPAGE_DEFAULTS)
+    page_url = ctx.page_url
+    node["@id"] = page_url + "#WebPage"
+    node["url"] = page_url
     node["name"] = ctx.name
     if ctx.description:
         node["description"] = ctx.description
@@ -165,74 +200,61 @@ def build_blog_posting_graph(
     blog_defaults: Optional[Dict[str, Any]] = None,
     **_,
 ) -> List[Dict[str, Any]]:
-    graph: List[Dict[str, Any]] = []
+    page_url = ctx.page_url
+    name, description, image_url = ctx.name, ctx.description, ctx.image_url
     added_orgs: set = set()
-    cfg = blog_defaults or {}
+    cfg = blog_defaults or _EMPTY
 
-    author_cfg = cfg.get("author") or {}
-    publisher_cfg = cfg.get("publisher") or {}
+    author_cfg = cfg.get("author") or _EMPTY
+    publisher_cfg = cfg.get("publisher") or _EMPTY
 
     author_org = resolve_organization(author_cfg, "naranja_x")
     publisher_org = resolve_organization(publisher_cfg, "naranja_x")
 
     editor_names = cfg.get("editors") or ["Natalí Ciappini", "Francisco Piccini"]
-    editors = [{"@type": "Person", "name": name} for name in editor_names if name]
+    editors = [{"@type": "Person", "name": editor} for editor in editor_names if editor]
 
     article_body = ctx.body_text or ""
-    word_count = len(re.findall(r"\w+", article_body)) if article_body else None
+    word_count = sum(1 for _ in _WORD_RE.finditer(article_body)) if article_body else None
 
     author_ref = organization_reference(author_org)
     author_ref["@type"] = "Organization"
     publisher_ref = organization_reference(publisher_org)
     publisher_ref["@type"] = "Organization"
 
+    optional_fields = (
+        ("editor", editors),
+        ("image", [image_url] if image_url else None),
+        ("articleBody", article_body),
+        ("wordCount", word_count),
+        ("datePublished", cfg.get("date_published") or cfg.get("datePublished")),
+        ("dateModified", cfg.get("date_modified") or cfg.get("dateModified")),
+        ("articleSection", cfg.get("article_section") or cfg.get("articleSection")),
+        ("keywords", cfg.get("keywords")),
+    )
+
     blog_posting: Dict[str, Any] = {
         "@type": "BlogPosting",
-        "@id": f"{ctx.page_url}#BlogPosting",
-        "url": ctx.page_url,
-        "headline": cfg.get("headline", ctx.name),
-        "description": cfg.get("description", ctx.description),
-        "mainEntityOfPage": {"@type": "WebPage", "@id": f"{ctx.page_url}#WebPage"},
+        "@id": page_url + "#BlogPosting",
+        "url": page_url,
+        "headline": cfg.get("headline", name),
+        "description": cfg.get("description", description),
+        "mainEntityOfPage": {"@type": "WebPage", "@id": page_url + "#WebPage"},
         "author": author_ref,
         "publisher": publisher_ref,
         "inLanguage": cfg.get("in_language", DEFAULT_LANGUAGE),
+        **{key: value for key, value in optional_fields if value},
     }
 
-    if editors:
-        blog_posting["editor"] = editors
-    if ctx.image_url:
-        blog_posting["image"] = [ctx.image_url]
-    if article_body:
-        blog_posting["articleBody"] = article_body
-    if word_count:
-        blog_posting["wordCount"] = word_count
-
-    date_published = cfg.get("date_published") or cfg.get("datePublished")
-    if date_published:
-        blog_posting["datePublished"] = date_published
-    date_modified = cfg.get("date_modified") or cfg.get("dateModified")
-    if date_modified:
-        blog_posting["dateModified"] = date_modified
-
-    article_section = cfg.get("article_section") or cfg.get("articleSection")
-    if article_section:
-        blog_posting["articleSection"] = article_section
-
-    keywords = cfg.get("keywords")
-    if keywords:
-        blog_posting["keywords"] = keywords
-
-    extra_fields = cfg.get("extra") or {}
+    extra_fields = cfg.get("extra") or _EMPTY
     if extra_fields:
-        blog_posting.update(deepcopy(extra_fields))
-
-    graph.append(blog_posting)
+        blog_posting.update(extra_fields)
 
     webpage_overrides = {
         "publisher": publisher_ref,
         "inLanguage": cfg.get("in_language", DEFAULT_LANGUAGE),
     }
-    graph.append(build_webpage_node(ctx, extra=webpage_overrides))
+    graph: List[Dict[str, Any]] = [blog_posting, build_webpage_node(ctx, extra=webpage_overrides)]
 
     append_organization(graph, author_org, added_orgs)
     append_organization(graph, publisher_org, added_orgs)
@@ -240,23 +262,28 @@ def build_blog_posting_graph(
     return graph
 
 
-def build_offer_catalog_node(
-    page_url: str, catalog_key: str
-) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
-    catalog = OFFER_CATALOGS.get(catalog_key)
+def _pick(*sources: Tuple[Mapping[str, Any], str], default: Any = None) -> Any:
+    """Primer valor no vacío entre los pares (mapa, clave), en orden; si no hay, `default`."""
+    for mapping, key in sources:
+        value = mapping.get(key)
+        if value:
+            return value
+    return default
+
+
+def _plan_offer_catalog(catalog_key: str, catalog: Mapping[str, Any]) -> Optional[Dict[str, Any]]:
+    """Precalcula la parte de un OfferCatalog que no depende de la página."""
     if not catalog:
-        return None, None
+        return None
 
-    node_id_suffix = re.sub(r"[^0-9A-Za-z]+", "-", catalog["name"]).strip("-") or catalog_key
-    node_id = f"{page_url}#OfferCatalog{node_id_suffix}"
+    node_id_suffix = _SLUG_RE.sub("-", catalog["name"]).strip("-") or catalog_key
 
-    item_list = []
+    items = []
     for idx, item in enumerate(catalog.get("items", []), start=1):
         name = item.get("name")
         url = item.get("url")
         if not name or not url:
             continue
-        offer_id = f"{node_id}-Offer{idx}"
 
         item_id_override = item.get("item_id") or item.get("@id")
         id_suffix = item.get("id_suffix")
@@ -271,112 +298,162 @@ def build_offer_catalog_node(
             if url:
                 item_offered["url"] = url
 
-        offer_props = item.get("offer", {}) if isinstance(item.get("offer"), dict) else {}
+        offer_props = item["offer"] if isinstance(item.get("offer"), Mapping) else _EMPTY
         offer_price = offer_props.get("price", catalog.get("default_price", "0"))
         if offer_price in (None, ""):
             offer_price = "0"
-        offer_currency = (
-            offer_props.get("priceCurrency")
-            or offer_props.get("price_currency")
-            or catalog.get("price_currency", "ARS")
+        offer_currency = _pick(
+            (offer_props, "priceCurrency"), (offer_props, "price_currency"), (catalog, "price_currency"), default="ARS"
         )
-        offer_availability = (
-            offer_props.get("availability") or catalog.get("availability", "https://schema.org/InStock")
+        offer_availability = _pick(
+            (offer_props, "availability"), (catalog, "availability"), default="https://schema.org/InStock"
         )
-        offer_price_valid_until = (
-            offer_props.get("priceValidUntil")
-            or offer_props.get("price_valid_until")
-            or catalog.get("price_valid_until")
+        offer_price_valid_until = _pick(
+            (offer_props, "priceValidUntil"), (offer_props, "price_valid_until"), (catalog, "price_valid_until")
         )
-        if not offer_price_valid_until:
-            offer_price_valid_until = default_price_valid_until()
 
-        offer_item = {
+        items.append(
+            (
+                f"-Offer{idx}",
+                name,
+                offer_price,
+                offer_currency,
+                offer_availability,
+                offer_price_valid_until or None,
+                MappingProxyType(item_offered),
+                url,
+            )
+        )
+
+    if not items:
+        return None
+
+    return {
+        "id_suffix": f"#OfferCatalog{node_id_suffix}",
+        "name": catalog["name"],
+        "items": tuple(items),
+        "provider_key": catalog.get("provider", "naranja_x"),
+    }
+
+
+# Tabla de despacho: un plan precalculado por `catalog_key`.
+_OFFER_CATALOG_PLANS: Dict[str, Optional[Dict[str, Any]]] = {
+    catalog_key: _plan_offer_catalog(catalog_key, catalog) for catalog_key, catalog in OFFER_CATALOGS.items()
+}
+
+
+def build_offer_catalog_node(
+    page_url: str, catalog_key: str
+) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    plan = _OFFER_CATALOG_PLANS.get(catalog_key)
+    if not plan:
+        return None, None
+
+    node_id = page_url + plan["id_suffix"]
+    item_list = [
+        {
             "@type": "Offer",
-            "@id": offer_id,
+            "@id": node_id + offer_suffix,
             "name": name,
-            "price": offer_price,
-            "priceCurrency": offer_currency,
-            "availability": offer_availability,
-            "priceValidUntil": offer_price_valid_until,
-            "itemOffered": item_offered,
+            "price": price,
+            "priceCurrency": currency,
+            "availability": availability,
+            "priceValidUntil": price_valid_until or default_price_valid_until(),
+            "itemOffered": dict(item_offered),
             "url": url,
         }
-        item_list.append(offer_item)
-
-    if not item_list:
-        return None, None
+        for (
+            offer_suffix,
+            name,
+            price,
+            currency,
+            availability,
+            price_valid_until,
+            item_offered,
+            url,
+        ) in plan["items"]
+    ]
 
     catalog_node: Dict[str, Any] = {
         "@type": "OfferCatalog",
         "@id": node_id,
-        "name": catalog["name"],
+        "name": plan["name"],
         "itemListElement": item_list,
     }
 
-    provider_key = catalog.get("provider", "naranja_x")
-    provider_org = ORGANIZATIONS.get(provider_key)
+    provider_org = ORGANIZATIONS.get(plan["provider_key"])
 
-    return catalog_node, deepcopy(provider_org) if provider_org else None
+    return catalog_node, thaw(provider_org) if provider_org else None
 
 
 def build_payment_card_graph(ctx: SchemaContext, **_) -> List[Dict[str, Any]]:
-    graph: List[Dict[str, Any]] = []
-    added_orgs: set = set()
+    page_url = ctx.page_url
+    name, description, image_url = ctx.name, ctx.description, ctx.image_url
 
-    offer_id = f"{ctx.page_url}#Offer"
+    offer_id = page_url + "#Offer"
+    offer_ref = {"@id": offer_id}
 
     payment_card: Dict[str, Any] = {
         "@type": "PaymentCard",
-        "@id": f"{ctx.page_url}#PaymentCard",
-        "url": ctx.page_url,
-        "name": ctx.name,
-        "description": ctx.description,
+        "@id": page_url + "#PaymentCard",
+        "url": page_url,
+        "name": name,
+        "description": description,
         "areaServed": "AR",
         "provider": [organization_reference("tarjeta_naranja")],
-        "mainEntityOfPage": ctx.page_url,
-        "offers": {"@id": offer_id},
+        "mainEntityOfPage": page_url,
+        "offers": offer_ref,
     }
-    if ctx.image_url:
-        payment_card["image"] = {"@type": "ImageObject", "@id": f"{ctx.page_url}#PaymentCardImage", "url": ctx.image_url}
-    graph.append(payment_card)
+    if image_url:
+        payment_card["image"] = {"@type": "ImageObject", "@id": page_url + "#PaymentCardImage", "url": image_url}
 
     price_valid_until = default_price_valid_until()
 
-    offer = build_offer_node(
-        ctx.page_url,
-        offer_id,
-        {
-            "name": ctx.name,
-            "price": "0",
-            "priceCurrency": "ARS",
-            "availability": "https://schema.org/InStock",
-            "areaServed": "AR",
-            "priceValidUntil": price_valid_until,
-        },
-    )
-    graph.append(offer)
+    offer = {
+        "@type": "Offer",
+        "@id": offer_id,
+        "url": page_url,
+        "name": name,
+        "price": "0",
+        "priceCurrency": "ARS",
+        "availability": "https://schema.org/InStock",
+        "areaServed": "AR",
+        "priceValidUntil": price_valid_until,
+    }
 
     product = build_product_node(
-        ctx.page_url,
-        f"{ctx.page_url}#Product",
-        ctx.name,
-        ctx.image_url,
+        page_url,
+        page_url + "#Product",
+        name,
+        image_url,
         ctx.aggregate_rating,
-        description=ctx.description,
-        extra={"url": ctx.page_url, "offers": {"@id": offer_id}},
+        description=description,
+        extra={"url": page_url, "offers": offer_ref},
     )
-    graph.append(product)
 
-    faq_page = build_faq_page(ctx.page_url, ctx.faqs, f"{ctx.page_url}#FAQPage")
-    if faq_page:
-        graph.append(faq_page)
+    faq_page = build_faq_page(page_url, ctx.faqs, page_url + "#FAQPage")
 
-    graph.append(build_webpage_node(ctx))
+    nodes = (
+        payment_card,
+        offer,
+        product,
+        faq_page,
+        build_webpage_node(ctx),
+        resolve_organization({}, "tarjeta_naranja"),
+    )
+    return [node for node in nodes if node is not None]
 
-    append_organization(graph, resolve_organization({}, "tarjeta_naranja"), added_orgs)
 
-    return graph
+_QV_KEYS = ("minValue", "maxValue", "unitText", "value")
+
+
+def _quantitative_node(cfg: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    if not isinstance(cfg, dict):
+        return None
+    present = {key: cfg[key] for key in _QV_KEYS if cfg.get(key) is not None}
+    if not present:
+        return None
+    return {"@type": cfg.get("@type", "QuantitativeValue"), **present}
 
 
 def build_loan_or_credit_graph(
@@ -385,44 +462,32 @@ def build_loan_or_credit_graph(
     loan_defaults: Optional[Dict[str, Any]] = None,
     **_,
 ) -> List[Dict[str, Any]]:
-    graph: List[Dict[str, Any]] = []
-    added_orgs: set = set()
+    page_url = ctx.page_url
+    name, description, image_url = ctx.name, ctx.description, ctx.image_url
 
-    defaults = deep_merge(LOAN_OR_CREDIT_DEFAULTS, loan_defaults or {})
-    amount_cfg = defaults.get("amount", {})
+    defaults = deep_merge(LOAN_OR_CREDIT_DEFAULTS, loan_defaults or _EMPTY)
+    amount_cfg = defaults.get("amount", _EMPTY)
     currency_value = defaults.get("currency") or amount_cfg.get("currency")
-    loan_term_cfg = defaults.get("loan_term", {})
-    interest_rate_cfg = defaults.get("interest_rate", {})
-    apr_cfg = defaults.get("annual_percentage_rate", {})
-    repayment_cfg = defaults.get("loan_repayment_form", {})
-    loan_type_value = defaults.get("loan_type") or ctx.name
-
-    def _quantitative_node(cfg: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        if not isinstance(cfg, dict):
-            return None
-        node: Dict[str, Any] = {"@type": cfg.get("@type", "QuantitativeValue")}
-        has_value = False
-        for key in ("minValue", "maxValue", "unitText", "value"):
-            value = cfg.get(key)
-            if value is not None:
-                node[key] = value
-                if key != "unitText":
-                    has_value = True
-        return node if has_value or len(node) > 1 else None
+    loan_term_cfg = defaults.get("loan_term", _EMPTY)
+    interest_rate_cfg = defaults.get("interest_rate", _EMPTY)
+    apr_cfg = defaults.get("annual_percentage_rate", _EMPTY)
+    repayment_cfg = defaults.get("loan_repayment_form", _EMPTY)
+    loan_type_value = defaults.get("loan_type") or name
 
-    offer_id = f"{ctx.page_url}#Offer"
+    offer_id = page_url + "#Offer"
+    offer_ref = {"@id": offer_id}
 
     loan_node: Dict[str, Any] = {
         "@type": "LoanOrCredit",
-        "@id": f"{ctx.page_url}#LoanOrCredit",
-        "url": ctx.page_url,
-        "name": ctx.name,
+        "@id": page_url + "#LoanOrCredit",
+        "url": page_url,
+        "name": name,
         "provider": [
             organization_reference("naranja_digital"),
             organization_reference("tarjeta_naranja"),
         ],
-        "mainEntityOfPage": ctx.page_url,
-        "offers": {"@id": offer_id},
+        "mainEntityOfPage": page_url,
+        "offers": offer_ref,
         "loanType": loan_type_value,
     }
 
@@ -462,9 +527,8 @@ def build_loan_or_credit_graph(
         if len(repayment_node) > 1:
             loan_node["loanRepaymentForm"] = repayment_node
 
-    if ctx.image_url:
-        loan_node["image"] = {"@type": "ImageObject", "@id": f"{ctx.page_url}#LoanImage", "url": ctx.image_url}
-    graph.append(loan_node)
+    if image_url:
+        loan_node["image"] = {"@type": "ImageObject", "@id": page_url + "#LoanImage", "url": image_url}
 
     offer_price = "0"
     if price_spec and isinstance(price_spec, dict):
@@ -473,41 +537,40 @@ def build_loan_or_credit_graph(
             offer_price = str(price_candidate)
     price_valid_until = default_price_valid_until()
 
-    offer = build_offer_node(
-        ctx.page_url,
-        offer_id,
-        {
-            "name": ctx.name,
-            "priceCurrency": "ARS",
-            "areaServed": "AR",
-            "availability": "https://schema.org/InStock",
-            "priceValidUntil": price_valid_until,
-            "price": offer_price,
-        },
-    )
-    graph.append(offer)
+    offer = {
+        "@type": "Offer",
+        "@id": offer_id,
+        "url": page_url,
+        "name": name,
+        "priceCurrency": "ARS",
+        "areaServed": "AR",
+        "availability": "https://schema.org/InStock",
+        "priceValidUntil": price_valid_until,
+        "price": offer_price,
+    }
 
     product = build_product_node(
-        ctx.page_url,
-        f"{ctx.page_url}#Product",
-        ctx.name,
-        ctx.image_url,
+        page_url,
+        page_url + "#Product",
+        name,
+        image_url,
         ctx.aggregate_rating,
-        description=ctx.description,
-        extra={"url": ctx.page_url, "offers": {"@id": offer_id}},
+        description=description,
+        extra={"url": page_url, "offers": offer_ref},
     )
-    graph.append(product)
-
-    faq_page = build_faq_page(ctx.page_url, ctx.faqs, f"{ctx.page_url}#FAQPage")
-    if faq_page:
-        graph.append(faq_page)
 
-    graph.append(build_webpage_node(ctx))
+    faq_page = build_faq_page(page_url, ctx.faqs, page_url + "#FAQPage")
 
-    append_organization(graph, resolve_organization({}, "naranja_digital"), added_orgs)
-    append_organization(graph, resolve_organization({}, "tarjeta_naranja"), added_orgs)
-
-    return graph
+    nodes = (
+        loan_node,
+        offer,
+        product,
+        faq_page,
+        build_webpage_node(ctx),
+        resolve_organization({}, "naranja_digital"),
+        resolve_organization({}, "tarjeta_naranja"),
+    )
+    return [node for node in nodes if node is not None]
 
 
 def build_bank_account_graph(
@@ -515,23 +578,17 @@ def build_bank_account_graph(
     bank_defaults: Optional[Dict[str, Any]] = None,
     **_,
 ) -> List[Dict[str, Any]]:
-    graph: List[Dict[str, Any]] = []
-    added_orgs: set = set()
-    today = date.today()
-    next_year_end = date(today.year + 1, 12, 31)
+    page_url = ctx.page_url
+    name, description, image_url = ctx.name, ctx.description, ctx.image_url
+    today_iso, next_year_end_iso = _date_window()
 
-    cfg = bank_defaults or {}
+    cfg = bank_defaults or _EMPTY
     price_currency = cfg.get("price_currency", "ARS")
-    valid_from = cfg.get("valid_from", today.isoformat())
-    valid_through = cfg.get("valid_through", next_year_end.isoformat())
-
-    area_served_place = {
-        "@type": "Place",
-        "name": "Argentina",
-        "address": {"@type": "PostalAddress", "addressCountry": "AR"},
-    }
+    valid_from = cfg.get("valid_from", today_iso)
+    valid_through = cfg.get("valid_through", next_year_end_iso)
 
-    offer_id = f"{ctx.page_url}#Offer"
+    offer_id = page_url + "#Offer"
+    offer_ref = {"@id": offer_id}
 
     bank_account_offer_price = cfg.get("price", "0")
     if bank_account_offer_price in (None, ""):
@@ -539,63 +596,61 @@ def build_bank_account_graph(
 
     bank_account = {
         "@type": "BankAccount",
-        "@id": f"{ctx.page_url}#bankaccount",
-        "name": ctx.name,
-        "description": ctx.description,
-        "areaServed": deepcopy(area_served_place),
+        "@id": page_url + "#bankaccount",
+        "name": name,
+        "description": description,
+        "areaServed": thaw(_AR_PLACE),
         "provider": organization_reference("tarjeta_naranja"),
-        "offers": {"@id": offer_id},
+        "offers": offer_ref,
     }
-    graph.append(bank_account)
 
     price_valid_until = cfg.get("price_valid_until") or valid_through or default_price_valid_until()
 
-    offer = build_offer_node(
-        ctx.page_url,
-        offer_id,
-        {
-            "priceCurrency": price_currency,
-            "availability": "https://schema.org/InStock",
-            "validFrom": valid_from,
-            "validThrough": valid_through,
-            "areaServed": deepcopy(area_served_place),
-            "eligibleRegion": "AR",
-            "seller": organization_reference("tarjeta_naranja"),
-            "priceValidUntil": price_valid_until,
-            "price": bank_account_offer_price,
-        },
-    )
-    graph.append(offer)
+    offer = {
+        "@type": "Offer",
+        "@id": offer_id,
+        "url": page_url,
+        "priceCurrency": price_currency,
+        "availability": "https://schema.org/InStock",
+        "validFrom": valid_from,
+        "validThrough": valid_through,
+        "areaServed": thaw(_AR_PLACE),
+        "eligibleRegion": "AR",
+        "seller": organization_reference("tarjeta_naranja"),
+        "priceValidUntil": price_valid_until,
+        "price": bank_account_offer_price,
+    }
 
     product = build_product_node(
-        ctx.page_url,
-        f"{ctx.page_url}#Product",
-        ctx.name,
-        ctx.image_url,
+        page_url,
+        page_url + "#Product",
+        name,
+        image_url,
         ctx.aggregate_rating,
-        description=ctx.description,
-        extra={"url": ctx.page_url, "offers": {"@id": offer_id}},
+        description=description,
+        extra={"url": page_url, "offers": offer_ref},
     )
-    graph.append(product)
 
     faq_page = build_faq_page(
-        ctx.page_url,
+        page_url,
         ctx.faqs,
-        f"{ctx.page_url}#faq",
+        page_url + "#faq",
         extra={
-            "url": ctx.page_url,
-            "name": f"Preguntas frecuentes sobre {ctx.name}",
+            "url": page_url,
+            "name": f"Preguntas frecuentes sobre {name}",
             "inLanguage": DEFAULT_LANGUAGE,
         },
     )
-    if faq_page:
-        graph.append(faq_page)
-
-    graph.append(build_webpage_node(ctx))
-
-    append_organization(graph, resolve_organization({}, "tarjeta_naranja"), added_orgs)
 
-    return graph
+    nodes = (
+        bank_account,
+        offer,
+        product,
+        faq_page,
+        build_webpage_node(ctx),
+        resolve_organization({}, "tarjeta_naranja"),
+    )
+    return [node for node in nodes if node is not None]
 
 
 def build_payment_service_graph(
@@ -604,201 +659,333 @@ def build_payment_service_graph(
     price_spec: Optional[Dict[str, Any]] = None,
     **_,
 ) -> List[Dict[str, Any]]:
-    graph: List[Dict[str, Any]] = []
-    added_orgs: set = set()
-    today = date.today()
-    next_year_end = date(today.year + 1, 12, 31)
+    page_url = ctx.page_url
+    name, description, image_url = ctx.name, ctx.description, ctx.image_url
+    today_iso, next_year_end_iso = _date_window()
 
-    cfg = deep_merge(PAYMENT_SERVICE_DEFAULTS, payment_service_defaults or {})
+    cfg = deep_merge(PAYMENT_SERVICE_DEFAULTS, payment_service_defaults or _EMPTY)
     area_served = deepcopy(cfg.get("area_served", {"@type": "Country", "name": "Argentina"}))
     provider = resolve_organization(cfg.get("provider"), PAYMENT_SERVICE_DEFAULTS["provider"]["org_key"])
 
+    offer_id = page_url + "#Offer"
+    offer_ref = {"@id": offer_id}
+
     service_node: Dict[str, Any] = {
         "@type": "PaymentService",
-        "@id": f"{ctx.page_url}#PaymentService",
-        "name": ctx.name,
-        "description": ctx.description,
+        "@id": page_url + "#PaymentService",
+        "name": name,
+        "description": description,
         "areaServed": deepcopy(area_served),
         "provider": organization_reference(provider),
-        "offers": {"@id": f"{ctx.page_url}#Offer"},
+        "offers": offer_ref,
     }
-    if ctx.image_url:
-        service_node["image"] = ctx.image_url
-    graph.append(service_node)
+    if image_url:
+        service_node["image"] = image_url
 
-    offer_cfg = cfg.get("offer", {})
-    valid_from = offer_cfg.get("valid_from", today.isoformat())
-    valid_through = offer_cfg.get("valid_through", next_year_end.isoformat())
+    offer_cfg = cfg.get("offer", _EMPTY)
+    valid_from = offer_cfg.get("valid_from", today_iso)
+    valid_through = offer_cfg.get("valid_through", next_year_end_iso)
     availability_starts = offer_cfg.get("availability_starts", valid_from)
     price_valid_until = offer_cfg.get("price_valid_until") or default_price_valid_until()
 
-    offer = build_offer_node(
-        ctx.page_url,
-        f"{ctx.page_url}#Offer",
-        {
-            "priceCurrency": offer_cfg.get("price_currency", "ARS"),
-            "areaServed": deepcopy(area_served),
-            "validFrom": valid_from,
-            "validThrough": valid_through,
-            "availabilityStarts": availability_starts,
-            "eligibleRegion": offer_cfg.get("eligible_region", "AR"),
-            "priceValidUntil": price_valid_until,
-            "price": offer_cfg.get("price", "0") or "0",
-        },
-    )
-    graph.append(offer)
+    offer = {
+        "@type": "Offer",
+        "@id": offer_id,
+        "url": page_url,
+        "priceCurrency": offer_cfg.get("price_currency", "ARS"),
+        "areaServed": deepcopy(area_served),
+        "validFrom": valid_from,
+        "validThrough": valid_through,
+        "availabilityStarts": availability_starts,
+        "eligibleRegion": offer_cfg.get("eligible_region", "AR"),
+        "priceValidUntil": price_valid_until,
+        "price": offer_cfg.get("price", "0") or "0",
+    }
 
     brand_ref = organization_reference(provider)
     brand_ref["@type"] = "Organization"
 
     product = build_product_node(
-        ctx.page_url,
-        f"{ctx.page_url}#Product",
-        ctx.name,
-        ctx.image_url,
+        page_url,
+        page_url + "#Product",
+        name,
+        image_url,
         ctx.aggregate_rating,
-        description=ctx.description,
-        extra={"url": ctx.page_url, "brand": brand_ref, "offers": {"@id": f"{ctx.page_url}#Offer"}},
+        description=description,
+        extra={"url": page_url, "brand": brand_ref, "offers": offer_ref},
     )
-    graph.append(product)
 
-    faq_page = build_faq_page(ctx.page_url, ctx.faqs, f"{ctx.page_url}#FAQPage")
-    if faq_page:
-        graph.append(faq_page)
+    faq_page = build_faq_page(page_url, ctx.faqs, page_url + "#FAQPage")
 
-    graph.append(build_webpage_node(ctx))
+    nodes = (service_node, offer, product, faq_page, build_webpage_node(ctx), provider)
+    return [node for node in nodes if node is not None]
 
-    append_organization(graph, provider, added_orgs)
 
-    return graph
+def _rate_part(code: str, value: Any) -> str:
+    """Formatea una tasa como `"TNA 45 %"` para la descripción del Offer."""
+    if isinstance(value, (int, float)):
+        formatted = f"{value:.2f}".rstrip("0").rstrip(".")
+    else:
+        formatted = str(value)
+    if formatted and not formatted.endswith("%"):
+        formatted += " %"
+    return f"{code} {formatted}".strip()
 
 
-def build_financial_product_graph(
-    ctx: SchemaContext,
-    financial_product_defaults: Optional[Dict[str, Any]] = None,
-    **_,
-) -> List[Dict[str, Any]]:
-    graph: List[Dict[str, Any]] = []
-    added_orgs: set = set()
-    today = date.today()
+_UNSET: Any = object()
+
+
+@dataclass(frozen=True)
+class _FinancialProductConfig:
+    """Parte de la configuración de FinancialProduct que no depende de la página."""
+
+    area_served: Any
+    provider: Dict[str, Any]
+    valid_from: Optional[str]
+    valid_from_offset: int
+    valid_through: Optional[str]
+    valid_through_offset: int
+    price_currency: Any
+    billing_increment: Any
+    min_price: Any
+    offer_area_served: Any
+    offer_description: str
+    identifier: Any
+    product_id: Optional[str]
+    product_id_suffix: str
+    product_name: Any
+    faq_id_suffix: str
+
+
+def _resolve_financial_product_config(overrides: Mapping[str, Any]) -> _FinancialProductConfig:
     defaults = FINANCIAL_PRODUCT_DEFAULTS
-    overrides = financial_product_defaults or {}
 
     area_served = overrides.get("area_served", defaults.get("area_served", "AR"))
 
-    provider_defaults = defaults.get("provider", {})
-    provider_overrides = overrides.get("provider", {})
-    provider_cfg = deep_merge(provider_defaults, provider_overrides)
+    provider_defaults = defaults.get("provider", _EMPTY)
+    provider_cfg = deep_merge(provider_defaults, overrides.get("provider", _EMPTY))
     provider = resolve_organization(provider_cfg, provider_defaults.get("org_key", "tarjeta_naranja"))
 
     rates = overrides.get("rates", FINANCIAL_PRODUCT_ZERO_RATES)
-    rate_parts = []
-    for code, value in (rates or {}).items():
-        if isinstance(value, (int, float)):
-            formatted = f"{value:.2f}".rstrip("0").rstrip(".")
-        else:
-            formatted = str(value)
-        if formatted and not formatted.endswith("%"):
-            formatted = f"{formatted} %"
-        rate_parts.append(f"{code} {formatted}".strip())
-    rates_text = ", ".join([p for p in rate_parts if p])
-
-    offer_defaults = defaults.get("offer", {})
-    offer_overrides = overrides.get("offer", {})
-    valid_from = offer_overrides.get("valid_from")
-    if not valid_from:
-        offset = offer_defaults.get("valid_from_offset", 0)
-        valid_from = (today + timedelta(days=offset)).isoformat()
-    valid_through = offer_overrides.get("valid_through")
-    if not valid_through:
-        offset = offer_defaults.get("valid_through_offset", 30)
-        valid_through = (today + timedelta(days=offset)).isoformat()
-    price_currency = offer_overrides.get("price_currency", offer_defaults.get("price_currency", "ARS"))
-    billing_increment = offer_overrides.get("billing_increment", offer_defaults.get("billing_increment", "1"))
-    min_price = offer_overrides.get("min_price", offer_defaults.get("min_price", "0"))
-    offer_area_served = offer_overrides.get("area_served", offer_defaults.get("area_served", area_served))
-    description_template = offer_overrides.get(
-        "description_template", offer_defaults.get("description_template", "Características financieras: {rates_text}.")
+    rates_text = ", ".join(filter(None, (_rate_part(code, value) for code, value in (rates or _EMPTY).items())))
+
+    offer_defaults = defaults.get("offer", _EMPTY)
+    offer_overrides = overrides.get("offer", _EMPTY)
+    offer_cfg = {**offer_defaults, **offer_overrides}
+    description_template = offer_cfg.get("description_template", "Características financieras: {rates_text}.")
+
+    product_overrides = overrides.get("product", _EMPTY)
+    product_cfg = {**defaults.get("product", _EMPTY), **product_overrides}
+
+    return _FinancialProductConfig(
+        area_served=area_served,
+        provider=provider,
+        valid_from=offer_overrides.get("valid_from") or None,
+        valid_from_offset=offer_defaults.get("valid_from_offset", 0),
+        valid_through=offer_overrides.get("valid_through") or None,
+        valid_through_offset=offer_defaults.get("valid_through_offset", 30),
+        price_currency=offer_cfg.get("price_currency", "ARS"),
+        billing_increment=offer_cfg.get("billing_increment", "1"),
+        min_price=offer_cfg.get("min_price", "0"),
+        offer_area_served=offer_cfg.get("area_served", area_served),
+        offer_description=offer_overrides.get("description") or description_template.format(rates_text=rates_text),
+        identifier=overrides.get("identifier", defaults.get("identifier")) or None,
+        product_id=product_overrides.get("id") or None,
+        product_id_suffix=product_cfg.get("id_suffix", "#Product"),
+        product_name=product_cfg.get("name", _UNSET),
+        faq_id_suffix=overrides.get("faq_id_suffix", defaults.get("faq_id_suffix", "#FAQPage")),
     )
-    offer_description = offer_overrides.get("description")
-    if not offer_description:
-        offer_description = description_template.format(rates_text=rates_text)
 
-    identifier = overrides.get("identifier", defaults.get("identifier"))
-    if not identifier:
-        slug = re.sub(r"[^0-9A-Za-z]+", "-", ctx.name).strip("-")
-        identifier = slug or None
 
-    product_defaults = defaults.get("product", {})
-    product_overrides = overrides.get("product", {})
-    product_id_suffix = product_overrides.get("id_suffix", product_defaults.get("id_suffix", "#Product"))
-    product_id = product_overrides.get("id") or f"{ctx.page_url}{product_id_suffix}"
-    product_name_value = product_overrides.get("name", product_defaults.get("name", ctx.name))
+@lru_cache(maxsize=1)
+def _default_financial_product_config() -> _FinancialProductConfig:
+    return _resolve_financial_product_config(_EMPTY)
+
+
+def build_financial_product_graph(
+    ctx: SchemaContext,
+    financial_product_defaults: Optional[Dict[str, Any]] = None,
+    **_,
+) -> List[Dict[str, Any]]:
+    page_url = ctx.page_url
+    name, description, image_url = ctx.name, ctx.description, ctx.image_url
+    today_ordinal = date.today().toordinal()
+    if financial_product_defaults:
+        cfg = _resolve_financial_product_config(financial_product_defaults)
+    else:
+        cfg = _default_financial_product_config()
+
+    provider = thaw(cfg.provider)
+    valid_from = cfg.valid_from or _offset_iso(today_ordinal, cfg.valid_from_offset)
+    valid_through = cfg.valid_through or _offset_iso(today_ordinal, cfg.valid_through_offset)
+    price_currency = cfg.price_currency
+    min_price = cfg.min_price
 
-    faq_id_suffix = overrides.get("faq_id_suffix", defaults.get("faq_id_suffix", "#FAQPage"))
-    faq_id = f"{ctx.page_url}{faq_id_suffix}"
+    identifier = cfg.identifier or _SLUG_RE.sub("-", name).strip("-") or None
 
-    offer_id = f"{ctx.page_url}#Offer"
+    product_id = cfg.product_id or page_url + cfg.product_id_suffix
+    product_name_value = name if cfg.product_name is _UNSET else cfg.product_name
+
+    faq_id = page_url + cfg.faq_id_suffix
+
+    offer_id = page_url + "#Offer"
+    offer_ref = {"@id": offer_id}
 
     financial_product = {
         "@type": "FinancialProduct",
-        "@id": f"{ctx.page_url}#FinancialProduct",
-        "name": ctx.name,
-        "description": ctx.description,
-        "areaServed": area_served,
+        "@id": page_url + "#FinancialProduct",
+        "name": name,
+        "description": description,
+        "areaServed": cfg.area_served,
         "provider": organization_reference(provider),
-        "offers": {"@id": offer_id},
+        "offers": offer_ref,
     }
-    if ctx.image_url:
-        financial_product["image"] = ctx.image_url
+    if image_url:
+        financial_product["image"] = image_url
     if identifier:
         financial_product["identifier"] = identifier
-    graph.append(financial_product)
-
-    append_organization(graph, provider, added_orgs)
 
     price_valid_until = default_price_valid_until()
 
-    offer = build_offer_node(
-        ctx.page_url,
-        offer_id,
-        {
-            "priceCurrency": price_currency,
-            "areaServed": offer_area_served,
-            "validFrom": valid_from,
-            "validThrough": valid_through,
-            "itemOffered": {"@id": product_id},
-            "priceValidUntil": price_valid_until,
+    offer = {
+        "@type": "Offer",
+        "@id": offer_id,
+        "url": page_url,
+        "priceCurrency": price_currency,
+        "areaServed": cfg.offer_area_served,
+        "validFrom": valid_from,
+        "validThrough": valid_through,
+        "itemOffered": {"@id": product_id},
+        "priceValidUntil": price_valid_until,
+        "price": min_price,
+        "priceSpecification": {
+            "@type": "UnitPriceSpecification",
+            "billingIncrement": cfg.billing_increment,
             "price": min_price,
-            "priceSpecification": {
-                "@type": "UnitPriceSpecification",
-                "billingIncrement": billing_increment,
-                "price": min_price,
-                "priceCurrency": price_currency,
-                "description": offer_description,
-            },
+            "priceCurrency": price_currency,
+            "description": cfg.offer_description,
         },
-    )
-    graph.append(offer)
+    }
 
     product = build_product_node(
-        ctx.page_url,
+        page_url,
         product_id,
         product_name_value,
-        ctx.image_url,
+        image_url,
         ctx.aggregate_rating,
-        description=ctx.description,
-        extra={"url": ctx.page_url, "offers": {"@id": offer_id}},
+        description=description,
+        extra={"url": page_url, "offers": offer_ref},
+    )
+
+    faq_page = build_faq_page(page_url, ctx.faqs, faq_id)
+
+    nodes = (financial_product, provider, offer, product, faq_page, build_webpage_node(ctx))
+    return [node for node in nodes if node is not None]
+
+
+@dataclass(frozen=True)
+class _InvestmentConfig:
+    """Parte de la configuración de InvestmentOrDeposit que no depende de la página."""
+
+    area_served: Any
+    provider: Dict[str, Any]
+    types: Tuple[Any, ...]
+    investment_id: Optional[str]
+    investment_id_suffix: str
+    alternate_name: Any
+    service_type: Any
+    audience: Any
+    identifier: Any
+    rate_type: Any
+    rate_unit: Any
+    rate_value: Any
+    offer_id: Optional[str]
+    offer_id_suffix: str
+    price_currency: Any
+    offer_area_served: Any
+    eligible_region: Any
+    availability: Any
+    valid_from: Optional[str]
+    valid_from_offset: int
+    valid_through: Optional[str]
+    valid_through_offset: int
+    offer_name: Any
+    investment_name: Any
+    duration: Any
+    product_id: Optional[str]
+    product_id_suffix: str
+    faq_id_suffix: str
+
+
+def _resolve_investment_config(overrides: Mapping[str, Any]) -> _InvestmentConfig:
+    defaults = INVESTMENT_OR_DEPOSIT_DEFAULTS
+
+    area_served = overrides.get("area_served", defaults.get("area_served", "AR"))
+    combined_globals = {**defaults.get("globals", _EMPTY), **overrides.get("globals", _EMPTY)}
+
+    provider_defaults = defaults.get("provider", _EMPTY)
+    provider_cfg = deep_merge(provider_defaults, overrides.get("provider", _EMPTY))
+    provider = resolve_organization(provider_cfg, provider_defaults.get("org_key", "naranja_x"))
+
+    investment_defaults_cfg = defaults.get("investment", _EMPTY)
+    investment_overrides = overrides.get("investment", _EMPTY)
+    investment_cfg = {**investment_defaults_cfg, **investment_overrides}
+
+    investment_types = investment_cfg.get("types", ("InvestmentOrDeposit",))
+    if isinstance(investment_types, str):
+        investment_types = (investment_types,)
+
+    interest_rate_cfg = {
+        "value": combined_globals.get("interest_rate", ""),
+        **investment_defaults_cfg.get("interest_rate", _EMPTY),
+        **investment_overrides.get("interest_rate", _EMPTY),
+    }
+
+    offer_defaults_cfg = defaults.get("offer", _EMPTY)
+    offer_overrides = overrides.get("offer", _EMPTY)
+    offer_cfg = {**offer_defaults_cfg, **offer_overrides}
+
+    product_overrides = overrides.get("product", _EMPTY)
+
+    return _InvestmentConfig(
+        area_served=area_served,
+        provider=provider,
+        types=tuple(investment_types),
+        investment_id=investment_overrides.get("id") or None,
+        investment_id_suffix=investment_cfg.get("id_suffix", "#investment"),
+        alternate_name=investment_cfg.get("alternate_name"),
+        service_type=investment_cfg.get("service_type"),
+        audience=investment_cfg.get("audience"),
+        identifier=overrides.get("identifier", investment_overrides.get("identifier")) or None,
+        rate_type=interest_rate_cfg.get("type", "QuantitativeValue"),
+        rate_unit=interest_rate_cfg.get("unit_text", "TNA"),
+        rate_value=interest_rate_cfg["value"],
+        offer_id=offer_overrides.get("id") or None,
+        offer_id_suffix=offer_cfg.get("id_suffix", "#offer"),
+        price_currency=offer_cfg.get("price_currency", "ARS"),
+        offer_area_served=offer_cfg.get("area_served", area_served),
+        eligible_region=offer_cfg.get("eligible_region", area_served),
+        availability=offer_cfg.get("availability", "https://schema.org/InStock"),
+        valid_from=offer_overrides.get("valid_from") or None,
+        valid_from_offset=offer_defaults_cfg.get("valid_from_offset", 0),
+        valid_through=offer_overrides.get("valid_through") or None,
+        valid_through_offset=offer_defaults_cfg.get("valid_through_offset", 0),
+        offer_name=offer_overrides.get("name", _UNSET),
+        investment_name=investment_overrides.get("name", _UNSET),
+        duration=offer_overrides.get("eligible_duration", combined_globals.get("duration", "")) or "",
+        product_id=product_overrides.get("id") or None,
+        product_id_suffix={**defaults.get("product", _EMPTY), **product_overrides}.get("id_suffix", "#product"),
+        faq_id_suffix=overrides.get("faq_id_suffix", defaults.get("faq_id_suffix", "#FAQPage")),
     )
-    graph.append(product)
 
-    faq_page = build_faq_page(ctx.page_url, ctx.faqs, faq_id)
-    if faq_page:
-        graph.append(faq_page)
 
-    graph.append(build_webpage_node(ctx))
+# Claves del nodo que se omiten cuando quedan vacías.
+_INVESTMENT_OPTIONAL_KEYS = ("alternateName", "serviceType", "audience", "image", "identifier")
 
-    return graph
+
+@lru_cache(maxsize=1)
+def _default_investment_config() -> _InvestmentConfig:
+    return _resolve_investment_config(_EMPTY)
 
 
 def build_investment_or_deposit_graph(
@@ -806,153 +993,170 @@ def build_investment_or_deposit_graph(
     investment_defaults: Optional[Dict[str, Any]] = None,
     **_,
 ) -> List[Dict[str, Any]]:
-    graph: List[Dict[str, Any]] = []
-    added_orgs: set = set()
-    today = date.today()
-    defaults = INVESTMENT_OR_DEPOSIT_DEFAULTS
-    overrides = investment_defaults or {}
-
-    area_served = overrides.get("area_served", defaults.get("area_served", "AR"))
-
-    base_globals = defaults.get("globals", {})
-    override_globals = overrides.get("globals", {})
-    combined_globals = {**base_globals, **override_globals}
+    page_url = ctx.page_url
+    name, description, image_url = ctx.name, ctx.description, ctx.image_url
+    today_ordinal = date.today().toordinal()
+    if investment_defaults:
+        cfg = _resolve_investment_config(investment_defaults)
+    else:
+        cfg = _default_investment_config()
 
-    provider_defaults = defaults.get("provider", {})
-    provider_overrides = overrides.get("provider", {})
-    provider_cfg = deep_merge(provider_defaults, provider_overrides)
-    provider = resolve_organization(provider_cfg, provider_defaults.get("org_key", "naranja_x"))
-
-    investment_defaults_cfg = defaults.get("investment", {})
-    investment_overrides = overrides.get("investment", {})
+    area_served = cfg.area_served
+    provider = thaw(cfg.provider)
 
-    investment_types = investment_overrides.get("types", investment_defaults_cfg.get("types", ["InvestmentOrDeposit"]))
-    if isinstance(investment_types, str):
-        investment_types = [investment_types]
+    investment_id = cfg.investment_id or page_url + cfg.investment_id_suffix
+    investment_identifier = cfg.identifier or _SLUG_RE.sub("-", name).strip("-") or None
 
-    investment_id_suffix = investment_overrides.get("id_suffix", investment_defaults_cfg.get("id_suffix", "#investment"))
-    investment_id = investment_overrides.get("id") or f"{ctx.page_url}{investment_id_suffix}"
-    investment_alternate_name = investment_overrides.get(
-        "alternate_name", investment_defaults_cfg.get("alternate_name")
-    )
-    investment_service_type = investment_overrides.get("service_type", investment_defaults_cfg.get("service_type"))
-    investment_audience = investment_overrides.get("audience", investment_defaults_cfg.get("audience"))
-
-    investment_identifier = overrides.get("identifier", investment_overrides.get("identifier"))
-    if not investment_identifier:
-        slug = re.sub(r"[^0-9A-Za-z]+", "-", ctx.name).strip("-")
-        investment_identifier = slug or None
-
-    interest_rate_defaults = investment_defaults_cfg.get("interest_rate", {})
-    interest_rate_overrides = investment_overrides.get("interest_rate", {})
-    interest_rate_type = interest_rate_overrides.get("type", interest_rate_defaults.get("type", "QuantitativeValue"))
-    interest_rate_unit = interest_rate_overrides.get("unit_text", interest_rate_defaults.get("unit_text", "TNA"))
-    default_rate_value = interest_rate_defaults.get("value", combined_globals.get("interest_rate", ""))
-    interest_rate_value = interest_rate_overrides.get("value", default_rate_value)
-
-    offer_defaults_cfg = defaults.get("offer", {})
-    offer_overrides = overrides.get("offer", {})
-    offer_id_suffix = offer_overrides.get("id_suffix", offer_defaults_cfg.get("id_suffix", "#offer"))
-    offer_id = offer_overrides.get("id") or f"{ctx.page_url}{offer_id_suffix}"
-    offer_price_currency = offer_overrides.get("price_currency", offer_defaults_cfg.get("price_currency", "ARS"))
-    offer_area_served = offer_overrides.get("area_served", offer_defaults_cfg.get("area_served", area_served))
-    offer_eligible_region = offer_overrides.get(
-        "eligible_region", offer_defaults_cfg.get("eligible_region", area_served)
-    )
-    offer_availability = offer_overrides.get(
-        "availability", offer_defaults_cfg.get("availability", "https://schema.org/InStock")
-    )
+    offer_id = cfg.offer_id or page_url + cfg.offer_id_suffix
+    offer_ref = {"@id": offer_id}
 
-    valid_from = offer_overrides.get("valid_from")
-    if not valid_from:
-        offset = offer_defaults_cfg.get("valid_from_offset", 0)
-        valid_from = (today + timedelta(days=offset)).isoformat()
-    valid_through = offer_overrides.get("valid_through")
-    if not valid_through:
-        offset = offer_defaults_cfg.get("valid_through_offset", 0)
-        valid_through = (today + timedelta(days=offset)).isoformat()
+    valid_from = cfg.valid_from or _offset_iso(today_ordinal, cfg.valid_from_offset)
+    valid_through = cfg.valid_through or _offset_iso(today_ordinal, cfg.valid_through_offset)
 
-    offer_name = offer_overrides.get("name", ctx.name or investment_overrides.get("name", ctx.name))
-    offer_duration = offer_overrides.get("eligible_duration", combined_globals.get("duration", "")) or ""
+    if cfg.offer_name is not _UNSET:
+        offer_name = cfg.offer_name
+    elif name or cfg.investment_name is _UNSET:
+        offer_name = name
+    else:
+        offer_name = cfg.investment_name
 
-    product_defaults_cfg = defaults.get("product", {})
-    product_overrides = overrides.get("product", {})
-    product_id_suffix = product_overrides.get("id_suffix", product_defaults_cfg.get("id_suffix", "#product"))
-    product_id = product_overrides.get("id") or f"{ctx.page_url}{product_id_suffix}"
+    product_id = cfg.product_id or page_url + cfg.product_id_suffix
 
-    faq_id_suffix = overrides.get("faq_id_suffix", defaults.get("faq_id_suffix", "#FAQPage"))
-    faq_id = f"{ctx.page_url}{faq_id_suffix}"
+    faq_id = page_url + cfg.faq_id_suffix
 
     investment_node: Dict[str, Any] = {
-        "@type": investment_types,
+        "@type": list(cfg.types),
         "@id": investment_id,
-        "name": ctx.name,
-        "description": ctx.description,
+        "name": name,
+        "description": description,
         "areaServed": area_served,
-        "mainEntityOfPage": ctx.page_url,
+        "mainEntityOfPage": page_url,
         "provider": provider,
-        "offers": {"@id": offer_id},
+        "offers": offer_ref,
         "interestRate": {
-            "@type": interest_rate_type,
-            "unitText": interest_rate_unit,
+            "@type": cfg.rate_type,
+            "unitText": cfg.rate_unit,
         },
+        "alternateName": cfg.alternate_name,
+        "serviceType": cfg.service_type,
+        "audience": thaw(cfg.audience),
+        "image": image_url,
+        "identifier": investment_identifier,
     }
+    for key in _INVESTMENT_OPTIONAL_KEYS:
+        if not investment_node[key]:
+            del investment_node[key]
 
-    if investment_alternate_name:
-        investment_node["alternateName"] = investment_alternate_name
-    if investment_service_type:
-        investment_node["serviceType"] = investment_service_type
-    if investment_audience:
-        investment_node["audience"] = investment_audience
-    if ctx.image_url:
-        investment_node["image"] = ctx.image_url
-    if investment_identifier:
-        investment_node["identifier"] = investment_identifier
-
-    if interest_rate_value not in (None, ""):
-        investment_node["interestRate"]["value"] = interest_rate_value
-
-    graph.append(investment_node)
-
-    append_organization(graph, provider, added_orgs)
+    if cfg.rate_value not in (None, ""):
+        investment_node["interestRate"]["value"] = cfg.rate_value
 
     price_valid_until = default_price_valid_until()
 
-    offer = build_offer_node(
-        ctx.page_url,
-        offer_id,
-        {
-            "name": offer_name,
-            "priceCurrency": offer_price_currency,
-            "areaServed": offer_area_served,
-            "eligibleRegion": offer_eligible_region,
-            "availability": offer_availability,
-            "validFrom": valid_from,
-            "validThrough": valid_through,
-            "priceValidUntil": price_valid_until,
-            "eligibleDuration": offer_duration,
-        },
-    )
-    graph.append(offer)
+    offer = {
+        "@type": "Offer",
+        "@id": offer_id,
+        "url": page_url,
+        "name": offer_name,
+        "priceCurrency": cfg.price_currency,
+        "areaServed": cfg.offer_area_served,
+        "eligibleRegion": cfg.eligible_region,
+        "availability": cfg.availability,
+        "validFrom": valid_from,
+        "validThrough": valid_through,
+        "priceValidUntil": price_valid_until,
+        "eligibleDuration": cfg.duration,
+    }
 
     product = build_product_node(
-        ctx.page_url,
+        page_url,
         product_id,
-        ctx.name,
-        ctx.image_url,
+        name,
+        image_url,
         ctx.aggregate_rating,
-        description=ctx.description,
-        extra={"url": ctx.page_url, "offers": {"@id": offer_id}},
+        description=description,
+        extra={"url": page_url, "offers": offer_ref},
     )
-    graph.append(product)
 
-    faq_page = build_faq_page(ctx.page_url, ctx.faqs, faq_id)
-    if faq_page:
-        graph.append(faq_page)
+    faq_page = build_faq_page(page_url, ctx.faqs, faq_id)
 
-    graph.append(build_webpage_node(ctx))
+    nodes = (investment_node, provider, offer, product, faq_page, build_webpage_node(ctx))
+    return [node for node in nodes if node is not None]
 
-    return graph
+
+_AGENCY_OPTIONAL_KEYS = ("identifier", "logo", "address", "sameAs")
+
+
+@dataclass(frozen=True)
+class _InsuranceAgencyConfig:
+    """Parte de la configuración de InsuranceAgency que no depende de la página."""
+
+    identifier: Optional[Dict[str, Any]]
+    logo: Dict[str, Any]
+    same_as: Tuple[Any, ...]
+    area_served: Any
+    addresses: Any
+    agency_id: Optional[str]
+    agency_id_suffix: str
+    offer_id: Optional[str]
+    offer_id_suffix: str
+    offer_name: Any
+    price_currency: Any
+    availability: Any
+    offer_area_served: Any
+    eligible_region: Any
+    price: Any
+    price_valid_until: Optional[str]
+    product_id: Optional[str]
+    product_id_suffix: str
+    category: Any
+
+
+def _resolve_insurance_config(overrides: Mapping[str, Any]) -> _InsuranceAgencyConfig:
+    defaults = INSURANCE_AGENCY_DEFAULTS
+
+    agency_base = defaults.get("agency", _EMPTY)
+    agency_overrides = overrides.get("agency", _EMPTY)
+
+    identifier = {**agency_base.get("identifier", _EMPTY), **agency_overrides.get("identifier", _EMPTY)}
+    if not identifier.get("propertyID") or not identifier.get("value"):
+        identifier = None
+
+    same_as = agency_overrides.get("same_as", agency_base.get("same_as")) or ()
+    if isinstance(same_as, str):
+        same_as = (same_as,)
+
+    offer_overrides = overrides.get("offer", _EMPTY)
+    offer_cfg = {**defaults.get("offer", _EMPTY), **offer_overrides}
+
+    product_overrides = overrides.get("product", _EMPTY)
+    product_cfg = {**defaults.get("product", _EMPTY), **product_overrides}
+
+    return _InsuranceAgencyConfig(
+        identifier=identifier,
+        logo={**agency_base.get("logo", _EMPTY), **agency_overrides.get("logo", _EMPTY)},
+        same_as=tuple(same_as),
+        area_served=overrides.get("area_served", agency_base.get("area_served", "AR")),
+        addresses=overrides.get("addresses", agency_base.get("addresses")),
+        agency_id=agency_overrides.get("id") or None,
+        agency_id_suffix=agency_overrides.get("id_suffix", agency_base.get("id_suffix", "#insurance-agency")),
+        offer_id=offer_overrides.get("id") or None,
+        offer_id_suffix=offer_cfg.get("id_suffix", "#offer"),
+        offer_name=offer_cfg.get("name", _UNSET),
+        price_currency=offer_cfg.get("price_currency", "ARS"),
+        availability=offer_cfg.get("availability", "https://schema.org/InStock"),
+        offer_area_served=offer_cfg.get("area_served", "AR"),
+        eligible_region=offer_cfg.get("eligible_region", "AR"),
+        price=offer_cfg.get("price", "0") or "0",
+        price_valid_until=offer_overrides.get("price_valid_until") or None,
+        product_id=product_overrides.get("id") or None,
+        product_id_suffix=product_cfg.get("id_suffix", "#producto"),
+        category=product_cfg.get("category"),
+    )
+
+
+@lru_cache(maxsize=1)
+def _default_insurance_config() -> _InsuranceAgencyConfig:
+    return _resolve_insurance_config(_EMPTY)
 
 
 def build_insurance_agency_graph(
@@ -960,110 +1164,80 @@ def build_insurance_agency_graph(
     insurance_defaults: Optional[Dict[str, Any]] = None,
     **_,
 ) -> List[Dict[str, Any]]:
-    graph: List[Dict[str, Any]] = []
-    added_orgs: set = set()
-    today = date.today()
-    next_year_end = date(today.year + 1, 12, 31)
-
-    defaults = INSURANCE_AGENCY_DEFAULTS
-    overrides = insurance_defaults or {}
-
-    agency_base = defaults.get("agency", {})
-    agency_overrides = overrides.get("agency", {})
-    agency_identifier = {
-        **agency_base.get("identifier", {}),
-        **agency_overrides.get("identifier", {}),
-    }
-    if not agency_identifier.get("propertyID") or not agency_identifier.get("value"):
-        agency_identifier = None
-    agency_logo = {**agency_base.get("logo", {}), **agency_overrides.get("logo", {})}
-    if not agency_logo.get("url") and ctx.image_url:
-        agency_logo["url"] = ctx.image_url
+    page_url = ctx.page_url
+    name, description, image_url = ctx.name, ctx.description, ctx.image_url
+    if insurance_defaults:
+        cfg = _resolve_insurance_config(insurance_defaults)
+    else:
+        cfg = _default_insurance_config()
 
-    agency_same_as = agency_overrides.get("same_as", agency_base.get("same_as", []))
-    if isinstance(agency_same_as, str):
-        agency_same_as = [agency_same_as]
+    agency_logo = dict(cfg.logo)
+    if not agency_logo.get("url") and image_url:
+        agency_logo["url"] = image_url
 
-    area_served = overrides.get("area_served", agency_base.get("area_served", "AR"))
-    addresses = overrides.get("addresses", agency_base.get("addresses"))
-
-    agency_id_suffix = agency_overrides.get("id_suffix", agency_base.get("id_suffix", "#insurance-agency"))
-    agency_id = agency_overrides.get("id") or f"{ctx.page_url}{agency_id_suffix}"
+    agency_id = cfg.agency_id or page_url + cfg.agency_id_suffix
 
     agency_node: Dict[str, Any] = {
         "@type": "InsuranceAgency",
         "@id": agency_id,
-        "name": ctx.name,
-        "description": ctx.description,
-        "areaServed": area_served,
-        "url": ctx.page_url,
+        "name": name,
+        "description": description,
+        "areaServed": thaw(cfg.area_served),
+        "url": page_url,
+        "identifier": dict(cfg.identifier) if cfg.identifier else None,
+        "logo": agency_logo,
+        "address": thaw(cfg.addresses),
+        "sameAs": list(cfg.same_as),
+    }
+    for key in _AGENCY_OPTIONAL_KEYS:
+        if not agency_node[key]:
+            del agency_node[key]
+
+    offer_id = cfg.offer_id or page_url + cfg.offer_id_suffix
+    offer_ref = {"@id": offer_id}
+
+    offer = {
+        "@type": "Offer",
+        "@id": offer_id,
+        "url": page_url,
+        "name": name if cfg.offer_name is _UNSET else cfg.offer_name,
+        "priceCurrency": cfg.price_currency,
+        "availability": cfg.availability,
+        "areaServed": cfg.offer_area_served,
+        "eligibleRegion": cfg.eligible_region,
+        "priceValidUntil": cfg.price_valid_until or default_price_valid_until(),
+        "price": cfg.price,
     }
-    if agency_identifier:
-        agency_node["identifier"] = agency_identifier
-    if agency_logo:
-        agency_node["logo"] = agency_logo
-    if addresses:
-        agency_node["address"] = addresses
-    if agency_same_as:
-        agency_node["sameAs"] = agency_same_as
-
-    graph.append(agency_node)
-
-    offer_defaults = defaults.get("offer", {})
-    offer_overrides = overrides.get("offer", {})
-    offer_id_suffix = offer_overrides.get("id_suffix", offer_defaults.get("id_suffix", "#offer"))
-    offer_id = offer_overrides.get("id") or f"{ctx.page_url}{offer_id_suffix}"
-    offer_name = offer_overrides.get("name", offer_defaults.get("name", ctx.name))
-    offer_price_currency = offer_overrides.get("price_currency", offer_defaults.get("price_currency", "ARS"))
-    offer_availability = offer_overrides.get("availability", offer_defaults.get("availability", "https://schema.org/InStock"))
-    offer_area_served = offer_overrides.get("area_served", offer_defaults.get("area_served", "AR"))
-    offer_eligible_region = offer_overrides.get("eligible_region", offer_defaults.get("eligible_region", "AR"))
-    offer_price = offer_overrides.get("price", offer_defaults.get("price", "0")) or "0"
-    price_valid_until = offer_overrides.get("price_valid_until") or default_price_valid_until()
-
-    offer = build_offer_node(
-        ctx.page_url,
-        offer_id,
-        {
-            "name": offer_name,
-            "priceCurrency": offer_price_currency,
-            "availability": offer_availability,
-            "areaServed": offer_area_served,
-            "eligibleRegion": offer_eligible_region,
-            "priceValidUntil": price_valid_until,
-            "price": offer_price,
-        },
-    )
-    graph.append(offer)
 
-    product_defaults = defaults.get("product", {})
-    product_overrides = overrides.get("product", {})
-    product_id_suffix = product_overrides.get("id_suffix", product_defaults.get("id_suffix", "#producto"))
-    product_id = product_overrides.get("id") or f"{ctx.page_url}{product_id_suffix}"
+    product_id = cfg.product_id or page_url + cfg.product_id_suffix
 
     product = build_product_node(
-        ctx.page_url,
+        page_url,
         product_id,
-        ctx.name,
-        ctx.image_url,
+        name,
+        image_url,
         ctx.aggregate_rating,
-        description=ctx.description,
-        extra={"url": ctx.page_url, "offers": {"@id": offer_id}},
+        description=description,
+        extra={"url": page_url, "offers": offer_ref},
     )
-    product_category = product_overrides.get("category", product_defaults.get("category"))
-    if product_category:
-        product["category"] = product_category
-    graph.append(product)
-
-    faq_page = build_faq_page(ctx.page_url, ctx.faqs, f"{ctx.page_url}#FAQPage")
-    if faq_page:
-        graph.append(faq_page)
-
-    graph.append(build_webpage_node(ctx))
-
-    append_organization(graph, resolve_organization({"@id": agency_id}, "naranja_x"), added_orgs)
-
-    return graph
+    if cfg.category:
+        product["category"] = cfg.category
+
+    faq_page = build_faq_page(page_url, ctx.faqs, page_url + "#FAQPage")
+
+    # Equivale a resolve_organization({"@id": agency_id}, "naranja_x") sin pasar por el merge genérico.
+    agency_org = thaw(ORGANIZATIONS[_ORG_KEY_BY_ID.get(agency_id, "naranja_x")])
+    agency_org["@id"] = agency_id
+
+    nodes = (
+        agency_node,
+        offer,
+        product,
+        faq_page,
+        build_webpage_node(ctx),
+        agency_org,
+    )
+    return [node for node in nodes if node is not None]
 
 
 SCHEMA_BUILDERS: Dict[str, Callable[..., List[Dict[str, Any]]]] = {
@@ -2,16 +2,24 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import re
-from copy import deepcopy
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from threading import Lock
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
-from bs4 import BeautifulSoup, Tag
+from cachetools import TTLCache, cached
+from selectolax.lexbor import LexborHTMLParser, LexborNode
 
 from ..config import DEFAULT_AGG_RATING
-from ..extraction import extract_basic_meta, extract_faqs, extract_flat_text
-from ..extraction.html import ensure_soup
+from ..extraction import (
+    extract_basic_meta,
+    extract_faqs,
+    extract_flat_text,
+    parse_tree_once,
+)
 from ..infrastructure.http import fetch_html
 from ..infrastructure.persistence import as_script_tag, save_outputs
 from ..models import ExtractionResult, SchemaContext, SchemaRecord
@@ -19,28 +27,71 @@ from ..schema import SCHEMA_BUILDERS, build_offer_catalog_node
 
 logger = logging.getLogger(__name__)
 
+EXTRACTION_CACHE_TTL = 3600
 
+_CAMEL_RE = re.compile(r"(?<!^)(?=[A-Z])")
+
+
+@lru_cache(maxsize=64)
 def _schema_type_key(schema_type: str) -> str:
-    return re.sub(r"(?<!^)(?=[A-Z])", "_", schema_type).lower().replace("-", "_").strip()
-
-
-def _select_body_node(soup: BeautifulSoup) -> Optional[Tag]:
-    candidates = [
-        soup.select_one("article"),
-        soup.select_one("main"),
-        soup.select_one("[role='main']"),
-        soup.body,
-    ]
-    return next(
-        (
-            candidate
-            for candidate in candidates
-            if isinstance(candidate, Tag) and candidate.get_text(strip=True)
-        ),
-        None,
+    return _CAMEL_RE.sub("_", schema_type).lower().replace("-", "_").strip()
+
+
+def _schema_type_aliases(key: str) -> Tuple[str, ...]:
+    return key, key.replace("_", "-"), "".join(part.capitalize() for part in key.split("_"))
+
+
+# Grafías habituales de cada schema_type resueltas directamente al builder.
+_BUILDER_DISPATCH: Dict[str, Callable[..., List[Dict[str, Any]]]] = {
+    alias: builder
+    for key, builder in SCHEMA_BUILDERS.items()
+    for alias in _schema_type_aliases(key)
+    if _schema_type_key(alias) == key
+}
+
+
+_BODY_SELECTORS = ("article", "main", "[role='main']")
+
+# Texto que `get_text()` de BeautifulSoup no contaba como contenido.
+_HIDDEN_TEXT_PARENTS = frozenset({"script", "style"})
+
+
+def _has_text(node: LexborNode) -> bool:
+    """Indica si el nodo contiene texto visible; corta en el primer nodo de texto útil."""
+    return any(
+        child.tag == "-text"
+        and child.parent.tag not in _HIDDEN_TEXT_PARENTS
+        and child.text_content.strip()
+        for child in node.traverse(include_text=True)
     )
 
 
+def _select_body_node(tree: LexborHTMLParser) -> Optional[LexborNode]:
+    for selector in _BODY_SELECTORS:
+        candidate = tree.css_first(selector)
+        if candidate is not None and _has_text(candidate):
+            return candidate
+    body = tree.body
+    return body if body is not None and _has_text(body) else None
+
+
+def _content_key(html: str, base_url: str) -> Tuple[bytes, str]:
+    return hashlib.blake2b(html.encode("utf-8"), digest_size=16).digest(), base_url
+
+
+@cached(TTLCache(maxsize=128, ttl=EXTRACTION_CACHE_TTL), key=_content_key, lock=Lock())
+def _extract_content(html: str, base_url: str) -> Tuple[Dict[str, str], Tuple[Dict[str, str], ...], str]:
+    """Extrae meta, FAQs y texto plano; se reutiliza mientras el HTML no cambie."""
+    tree = parse_tree_once(html)
+    meta = extract_basic_meta(html, base_url=base_url, tree=tree)
+
+    faqs = extract_faqs(tree)
+
+    body_node = _select_body_node(tree)
+    body_text = extract_flat_text(body_node) if body_node else ""
+    return meta, tuple(faqs), body_text
+
+
 def build_schema_from_url(
     url: str,
     nombre: str,
@@ -56,26 +107,26 @@ def build_schema_from_url(
     blog_defaults: Optional[Dict[str, Any]] = None,
     offer_catalog_key: Optional[str] = None,
     aggregate_rating: Optional[Dict[str, Any]] = None,
+    refresh: bool = False,
 ) -> SchemaRecord:
-    html, base_url, final_url = fetch_html(url)
-    soup = ensure_soup(html)
-    meta = extract_basic_meta(html, base_url=base_url, soup=soup)
+    """Descarga la página y arma su grafo; los nodos se crean por llamada, no hace falta copiarlos.
 
-    faqs = extract_faqs(soup)
-
-    body_node = _select_body_node(soup)
-    body_text = extract_flat_text(body_node) if body_node else ""
+    `refresh=True` ignora la copia cacheada de la página y la vuelve a descargar.
+    """
+    html, base_url, final_url = fetch_html(url, refresh=refresh)
+    meta, cached_faqs, body_text = _extract_content(html, base_url)
+    faqs = [dict(faq) for faq in cached_faqs]
 
     image_url = meta.get("image", "") or ""
     description_text = meta.get("description", "") or ""
 
     agg_source = aggregate_rating if aggregate_rating is not None else DEFAULT_AGG_RATING
-    agg_rating = deepcopy(agg_source) if agg_source else None
+    # Copia superficial: solo se toca `@type` en el primer nivel.
+    agg_rating = {**agg_source} if agg_source else None
     if agg_rating is not None:
         agg_rating.setdefault("@type", "AggregateRating")
 
-    key = _schema_type_key(schema_type)
-    builder = SCHEMA_BUILDERS.get(key)
+    builder = _BUILDER_DISPATCH.get(schema_type) or SCHEMA_BUILDERS.get(_schema_type_key(schema_type))
     if builder is None:
         raise ValueError(f"schema_type desconocido: {schema_type}")
 
@@ -105,14 +156,9 @@ def build_schema_from_url(
         catalog_node, provider_org = build_offer_catalog_node(context.page_url, offer_catalog_key)
         if catalog_node:
             graph_nodes.append(catalog_node)
-            if provider_org and provider_org.get("@id"):
-                existing_ids = {
-                    node.get("@id")
-                    for node in graph_nodes
-                    if isinstance(node, Dict) and node.get("@id")
-                }
-                if provider_org["@id"] not in existing_ids:
-                    graph_nodes.append(provider_org)
+            provider_id = provider_org.get("@id") if provider_org else None
+            if provider_id and not any(node.get("@id") == provider_id for node in graph_nodes):
+                graph_nodes.append(provider_org)
 
     schema_graph = {"@context": "https://schema.org", "@graph": graph_nodes}
 
@@ -133,6 +179,43 @@ def build_schema_from_url(
     )
 
 
+def build_schemas_from_urls(
+    jobs: Iterable[Tuple[str, str, str]],
+    *,
+    max_workers: int = 8,
+    return_exceptions: bool = False,
+    **options: Any,
+) -> List[Union[SchemaRecord, Exception]]:
+    """Arma varios schemas `(url, nombre, schema_type)` solapando las descargas; respeta el orden.
+
+    Sin `jobs` devuelve una lista vacía. Por defecto la llamada falla completa: la primera
+    URL con error (en el orden de `jobs`) propaga su excepción y se cancelan los trabajos
+    que no empezaron. Con `return_exceptions=True` la excepción ocupa el lugar de esa URL
+    y el resto de los resultados se conserva.
+    """
+    if max_workers < 1:
+        raise ValueError(f"max_workers debe ser mayor a 0: {max_workers}")
+    pending = list(jobs)
+    if not pending:
+        return []
+    results: List[Union[SchemaRecord, Exception]] = []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as pool:
+        futures = [
+            pool.submit(build_schema_from_url, url, nombre, schema_type, **options)
+            for url, nombre, schema_type in pending
+        ]
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as exc:
+                if not return_exceptions:
+                    for other in futures:
+                        other.cancel()
+                    raise
+                results.append(exc)
+    return results
+
+
 def generate_schema(
     url: str,
     nombre: str,
@@ -153,6 +236,7 @@ def generate_schema(
     jsonl_path: str = "schemas.jsonl",
     as_script: bool = False,
     schema_only: bool = False,
+    refresh: bool = False,
 ):
     record = build_schema_from_url(
         url,
@@ -168,6 +252,7 @@ def generate_schema(
         blog_defaults=blog_defaults,
         offer_catalog_key=offer_catalog_key,
         aggregate_rating=aggregate_rating,
+        refresh=refresh,
     )
 
     if save:
@@ -0,0 +1,179 @@
+import copy
+import datetime
+import json
+import os
+from pathlib import Path
+from types import MappingProxyType
+
+import pytest
+
+from schema_automation import config
+from schema_automation.models import SchemaContext
+from schema_automation.schema import SCHEMA_BUILDERS, build_offer_catalog_node
+from schema_automation.schema import builders
+
+GOLDEN_DIR = Path(__file__).parent / "golden"
+# `UPDATE_GOLDEN=1 pytest tests/test_builders.py` regenera los archivos esperados.
+UPDATE_GOLDEN = os.environ.get("UPDATE_GOLDEN") == "1"
+
+PAGE_URL = "https://www.naranjax.com/producto"
+
+OVERRIDES = {
+    "payment_card": {},
+    "loan_or_credit": {
+        "loan_defaults": {"amount": {"minValue": 5}, "loan_type": "Personal", "interest_rate": {"unitText": None}},
+        "price_spec": {"price": 100},
+    },
+    "bank_account": {
+        "bank_defaults": {"price": "", "valid_from": "2020-01-01", "price_valid_until": "2030-01-01"},
+    },
+    "payment_service": {
+        "payment_service_defaults": {
+            "provider": {"org_key": "tarjeta_naranja"},
+            "offer": {"price": None, "valid_from": "2021-01-01"},
+        },
+    },
+    "financial_product": {
+        "financial_product_defaults": {
+            "rates": {"TNA": 55.5, "TEA": "71%", "X": 3.0, "Y": ""},
+            "offer": {"valid_from": "2022-02-02"},
+            "identifier": "abc",
+            "product": {"name": "P", "id": "urn:p"},
+            "provider": {"org_key": "naranja_x", "id": "https://www.naranjax.com/#OrgNaranjaDigital"},
+        },
+    },
+    "investment_or_deposit": {
+        "investment_defaults": {
+            "investment": {"types": "X", "interest_rate": {"value": 7}, "audience": None},
+            "offer": {"name": "N", "id": "urn:o"},
+            "provider": {"overrides": {"name": "Over"}, "sameAs": ["a"]},
+            "globals": {"duration": "P28D", "interest_rate": "42"},
+        },
+    },
+    "insurance_agency": {
+        "insurance_defaults": {
+            "agency": {
+                "same_as": "https://s",
+                "identifier": {"value": ""},
+                "logo": {"url": ""},
+                "id": "urn:a",
+            },
+            "offer": {"price": ""},
+            "product": {"category": ""},
+            "addresses": [],
+        },
+    },
+    "blog_posting": {
+        "blog_defaults": {
+            "editors": [],
+            "headline": "H",
+            "datePublished": "2020",
+            "date_modified": "2021",
+            "articleSection": "S",
+            "keywords": "k",
+            "extra": {"x": {"y": 1}},
+            "author": {"org_key": "tarjeta_naranja"},
+            "in_language": "en",
+        },
+    },
+}
+
+
+class _FixedDate(datetime.date):
+    @classmethod
+    def today(cls):
+        return cls(2025, 1, 15)
+
+
+@pytest.fixture(autouse=True)
+def _fixed_today(monkeypatch):
+    monkeypatch.setattr(builders, "date", _FixedDate)
+    monkeypatch.setattr(config, "date", _FixedDate)
+
+
+def _context(minimal=False):
+    if minimal:
+        return SchemaContext(
+            page_url=PAGE_URL,
+            name="Producto X",
+            description="",
+            image_url=None,
+            faqs=[],
+            body_text=None,
+            aggregate_rating=None,
+        )
+    return SchemaContext(
+        page_url=PAGE_URL,
+        name="Producto X!!",
+        description="Descripción del producto",
+        image_url="https://www.naranjax.com/img/producto.png",
+        faqs=[
+            {"question": "¿Qué es?", "answer": "Un producto."},
+            {"question": "¿Cuánto cuesta?", "answer": "Nada."},
+        ],
+        body_text="Texto del cuerpo",
+        aggregate_rating={"@type": "AggregateRating", "ratingValue": 4.6, "ratingCount": 10},
+    )
+
+
+def _build(schema_type, variant):
+    kwargs = copy.deepcopy(OVERRIDES[schema_type]) if variant == "overrides" else {}
+    return SCHEMA_BUILDERS[schema_type](_context(minimal=variant == "minimal"), **kwargs)
+
+
+def _check_golden(name, actual):
+    path = GOLDEN_DIR / f"{name}.json"
+    if UPDATE_GOLDEN:
+        GOLDEN_DIR.mkdir(exist_ok=True)
+        path.write_text(json.dumps(actual, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    assert actual == json.loads(path.read_text(encoding="utf-8"))
+
+
+def _walk(value):
+    yield value
+    if isinstance(value, dict):
+        for item in value.values():
+            yield from _walk(item)
+    elif isinstance(value, (list, tuple, MappingProxyType)):
+        for item in value.values() if isinstance(value, MappingProxyType) else value:
+            yield from _walk(item)
+
+
+def _assert_plain_json(graph):
+    for value in _walk(graph):
+        assert not isinstance(value, (MappingProxyType, tuple)), value
+        assert value is None or isinstance(value, (dict, list, str, int, float, bool))
+
+
+def _mutable_ids(graph):
+    return {id(value) for value in _walk(graph) if isinstance(value, (dict, list))}
+
+
+@pytest.mark.parametrize("schema_type", sorted(SCHEMA_BUILDERS))
+def test_builder_matches_golden_output(schema_type):
+    actual = {variant: _build(schema_type, variant) for variant in ("default", "overrides", "minimal")}
+
+    _check_golden(schema_type, actual)
+
+
+@pytest.mark.parametrize("schema_type", sorted(SCHEMA_BUILDERS))
+@pytest.mark.parametrize("variant", ["default", "overrides"])
+def test_builder_output_is_plain_and_unshared(schema_type, variant):
+    first = _build(schema_type, variant)
+    second = _build(schema_type, variant)
+
+    _assert_plain_json(first)
+    assert not _mutable_ids(first) & _mutable_ids(second)
+
+
+def test_offer_catalogs_match_golden_output():
+    actual = {}
+    for catalog_key in sorted(config.OFFER_CATALOGS):
+        catalog, provider = build_offer_catalog_node(PAGE_URL, catalog_key)
+        _assert_plain_json([catalog, provider])
+        again = build_offer_catalog_node(PAGE_URL, catalog_key)
+        assert not _mutable_ids([catalog, provider]) & _mutable_ids(list(again))
+        actual[catalog_key] = {"catalog": catalog, "provider": provider}
+
+    assert build_offer_catalog_node(PAGE_URL, "inexistente") == (None, None)
+    _check_golden("offer_catalogs", actual)
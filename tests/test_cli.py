@@ -0,0 +1,58 @@
+import contextlib
+import io
+import json
+
+import pytest
+
+from schema_automation import cli
+from schema_automation.service import workflow
+
+
+def test_main_writes_json_to_text_stdout(monkeypatch):
+    monkeypatch.setattr(workflow, "generate_schema", lambda url, nombre, **kwargs: {"url": url, "name": nombre})
+    out = io.StringIO()
+
+    with contextlib.redirect_stdout(out):
+        assert cli.main(["https://example.com", "Ejemplo", "--schema-only"]) == 0
+
+    assert json.loads(out.getvalue()) == {"url": "https://example.com", "name": "Ejemplo"}
+
+
+
+def test_main_stringifies_non_str_keys(monkeypatch):
+    monkeypatch.setattr(workflow, "generate_schema", lambda url, nombre, **kwargs: {"extra": {1: "uno"}})
+    out = io.StringIO()
+
+    with contextlib.redirect_stdout(out):
+        assert cli.main(["https://example.com", "Ejemplo", "--schema-only"]) == 0
+
+    assert json.loads(out.getvalue()) == {"extra": {"1": "uno"}}
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["https://example.com", "Ejemplo"],
+        ["https://example.com", "Ejemplo", "--schema-only"],
+        ["https://example.com", "Ejemplo", "--script", "--schema-type", "bank_account"],
+        ["https://example.com", "Ejemplo", "--schema-type=loan_or_credit", "--offer-catalog", "cuenta"],
+        ["--set", "a=1", "https://example.com", "--set=b=", "Ejemplo", "--set", "c=x=y"],
+    ],
+)
+def test_fast_parse_args_matches_argparse(argv):
+    assert cli._fast_parse_args(argv) == cli.build_parser().parse_args(argv)
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["https://example.com"],
+        ["https://example.com", "Ejemplo", "extra"],
+        ["https://example.com", "Ejemplo", "--help"],
+        ["https://example.com", "Ejemplo", "--schema-type"],
+        ["https://example.com", "Ejemplo", "--unknown"],
+        ["https://example.com", "Ejemplo", "--schema"],
+    ],
+)
+def test_fast_parse_args_defers_to_argparse(argv):
+    assert cli._fast_parse_args(argv) is None
@@ -0,0 +1,35 @@
+from types import MappingProxyType
+
+import pytest
+
+from schema_automation import config
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "ORGANIZATIONS",
+        "WEBPAGE_DEFAULTS",
+        "PRICE_SPEC_DEFAULT",
+        "PAYMENT_SERVICE_DEFAULTS",
+        "INSURANCE_AGENCY_DEFAULTS",
+        "FINANCIAL_PRODUCT_DEFAULTS",
+        "INVESTMENT_OR_DEPOSIT_DEFAULTS",
+        "OFFER_CATALOGS",
+        "DEFAULT_AGG_RATING",
+        "FINANCIAL_PRODUCT_ZERO_RATES",
+        "LOAN_OR_CREDIT_DEFAULTS",
+    ],
+)
+def test_module_defaults_are_read_only(name):
+    value = getattr(config, name)
+
+    assert isinstance(value, MappingProxyType)
+    with pytest.raises(TypeError):
+        value["nuevo"] = 1
+
+
+def test_nested_defaults_are_read_only():
+    with pytest.raises(TypeError):
+        config.LOAN_OR_CREDIT_DEFAULTS["amount"]["minValue"] = 1
+    assert isinstance(config.NARANJA_X_ADDRESSES, tuple)
@@ -0,0 +1,62 @@
+from pathlib import Path
+
+import pytest
+
+from schema_automation.extraction import extract_basic_meta, extract_faqs
+from schema_automation.service import workflow
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture
+def accordion_html():
+    return (FIXTURES / "accordion.html").read_text(encoding="utf-8")
+
+
+@pytest.fixture
+def fallback_html():
+    return (FIXTURES / "fallback.html").read_text(encoding="utf-8")
+
+
+def test_extract_basic_meta_prefers_open_graph(accordion_html):
+    meta = extract_basic_meta(accordion_html, base_url="https://x.com/a/")
+
+    assert meta == {
+        "title": "OG Título",
+        "description": "Descripción de prueba",
+        "image": "https://x.com/img/card.png",
+    }
+
+
+def test_extract_faqs_from_accordion_dedupes_and_skips_empty(accordion_html):
+    assert extract_faqs(accordion_html) == [
+        {"question": "¿Qué es Naranja X?", "answer": "Es una fintech.\n\n• Uno\n• Dos bold"},
+        {"question": "¿Cuánto cuesta?", "answer": "Nada, es gratis."},
+        {"question": "Sin signo", "answer": "Respuesta hermana"},
+    ]
+
+
+def test_extract_faqs_fallback_pairs_questions_with_next_element(fallback_html):
+    assert extract_faqs(fallback_html) == [
+        {"question": "¿Pregunta A?", "answer": "Resp A"},
+        {"question": "¿B?", "answer": "Resp B"},
+    ]
+
+
+def test_build_schema_from_url_extracts_body_text(monkeypatch, accordion_html):
+    monkeypatch.setattr(
+        workflow,
+        "fetch_html",
+        lambda url, **kwargs: (accordion_html, "https://x.com/a/", "https://x.com/a/final"),
+    )
+
+    record = workflow.build_schema_from_url("https://x.com/a/", "Ejemplo")
+
+    assert record.url == "https://x.com/a/final"
+    assert record.extracted.title == "OG Título"
+    assert len(record.extracted.faqs) == 3
+    body_text = record.extracted.body_text
+    assert body_text.startswith("Hola mundo Texto uno con cero y fi ligadura. Línea dos tres")
+    assert "var x" not in body_text
+    assert "Header nav" not in body_text
+    assert "pie" not in body_text
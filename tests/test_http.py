@@ -0,0 +1,65 @@
+import pytest
+
+from schema_automation.infrastructure import http
+
+URL = "https://example.com/pagina"
+
+
+@pytest.fixture(autouse=True)
+def _empty_caches():
+    http.clear_fetch_cache()
+    http._VALIDATORS.clear()
+    yield
+    http.clear_fetch_cache()
+    http._VALIDATORS.clear()
+
+
+def test_fetch_html_serves_repeated_calls_from_cache(requests_mock):
+    requests_mock.get(URL, text="<html><body>uno</body></html>")
+
+    first = http.fetch_html(URL)
+    second = http.fetch_html(URL)
+
+    assert second == first == ("<html><body>uno</body></html>", URL, URL)
+    assert requests_mock.call_count == 1
+
+
+def test_fetch_html_refetches_after_clear_or_refresh(requests_mock):
+    requests_mock.get(URL, [{"text": "v1"}, {"text": "v2"}, {"text": "v3"}])
+
+    assert http.fetch_html(URL)[0] == "v1"
+    http.clear_fetch_cache()
+    assert http.fetch_html(URL)[0] == "v2"
+    assert http.fetch_html(URL, refresh=True)[0] == "v3"
+    assert http.fetch_html(URL)[0] == "v3"
+    assert requests_mock.call_count == 3
+
+
+def test_fetch_html_reuses_previous_result_on_304(requests_mock):
+    requests_mock.get(
+        URL,
+        [
+            {"text": "v1", "headers": {"ETag": '"abc"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"}},
+            {"status_code": 304},
+        ],
+    )
+
+    first = http.fetch_html(URL)
+    second = http.fetch_html(URL, refresh=True)
+
+    assert second == first == ("v1", URL, URL)
+    assert requests_mock.call_count == 2
+    conditional = requests_mock.request_history[1].headers
+    assert conditional["If-None-Match"] == '"abc"'
+    assert conditional["If-Modified-Since"] == "Wed, 01 Jan 2025 00:00:00 GMT"
+    assert "If-None-Match" not in requests_mock.request_history[0].headers
+
+
+def test_fetch_html_sends_unconditional_get_without_validators(requests_mock):
+    requests_mock.get(URL, [{"text": "v1"}, {"text": "v2"}])
+
+    http.fetch_html(URL)
+    assert http.fetch_html(URL, refresh=True)[0] == "v2"
+
+    headers = requests_mock.request_history[1].headers
+    assert "If-None-Match" not in headers and "If-Modified-Since" not in headers
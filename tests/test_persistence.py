@@ -0,0 +1,72 @@
+import csv
+import json
+
+from schema_automation.infrastructure.persistence import as_script_tag, save_outputs, save_outputs_many
+from schema_automation.models import ExtractionResult, SchemaRecord
+
+
+def _record(url):
+    return SchemaRecord(
+        url=url,
+        name="Ejemplo",
+        schema_type="payment_card",
+        extracted=ExtractionResult(
+            title="Título",
+            description="Descripción",
+            image="",
+            faqs=[{"question": "¿Q?", "answer": "R"}],
+            body_text="texto",
+        ),
+        schema={"@context": "https://schema.org", "@graph": []},
+    )
+
+
+def test_save_outputs_many_writes_header_once_and_appends(tmp_path):
+    csv_path = tmp_path / "out" / "extracciones.csv"
+    jsonl_path = tmp_path / "out" / "schemas.jsonl"
+
+    save_outputs_many([_record("https://e.com/1")], csv_path=str(csv_path), jsonl_path=str(jsonl_path))
+    save_outputs_many(
+        [_record("https://e.com/2"), _record("https://e.com/3")],
+        csv_path=str(csv_path),
+        jsonl_path=str(jsonl_path),
+    )
+
+    lines = csv_path.read_text(encoding="utf-8").splitlines()
+    assert lines[0] == "url,name,title,description,image,faqs_count,faqs_json"
+    assert sum(line.startswith("url,") for line in lines) == 1
+
+    with csv_path.open(encoding="utf-8", newline="") as fh:
+        rows = list(csv.DictReader(fh))
+    assert [row["url"] for row in rows] == ["https://e.com/1", "https://e.com/2", "https://e.com/3"]
+    assert rows[0]["faqs_count"] == "1"
+    assert json.loads(rows[0]["faqs_json"]) == [{"question": "¿Q?", "answer": "R"}]
+
+    entries = [json.loads(line) for line in jsonl_path.read_text(encoding="utf-8").splitlines()]
+    assert [entry["url"] for entry in entries] == ["https://e.com/1", "https://e.com/2", "https://e.com/3"]
+    assert entries[0]["schema"] == {"@context": "https://schema.org", "@graph": []}
+
+
+def test_save_outputs_writes_header_into_existing_empty_file(tmp_path):
+    csv_path = tmp_path / "extracciones.csv"
+    csv_path.touch()
+
+    save_outputs(_record("https://e.com/1"), csv_path=str(csv_path), jsonl_path=str(tmp_path / "s.jsonl"))
+
+    lines = csv_path.read_text(encoding="utf-8").splitlines()
+    assert lines[0].startswith("url,name,")
+    assert len(lines) == 2
+
+
+def test_save_outputs_many_stringifies_non_str_keys(tmp_path):
+    record = _record("https://e.com/1")
+    record.schema = {"@graph": [{"extra": {1: "uno"}}]}
+    jsonl_path = tmp_path / "schemas.jsonl"
+
+    save_outputs_many([record], csv_path=str(tmp_path / "e.csv"), jsonl_path=str(jsonl_path))
+
+    assert json.loads(jsonl_path.read_text(encoding="utf-8")) == {
+        "url": "https://e.com/1",
+        "schema": {"@graph": [{"extra": {"1": "uno"}}]},
+    }
+    assert '"1": "uno"' in as_script_tag(record.schema)
@@ -0,0 +1,25 @@
+from selectolax.lexbor import LexborHTMLParser
+
+from schema_automation.extraction.text import clean_text, extract_flat_text, node_text
+
+
+def test_clean_text_normalizes_whitespace_and_invisible_chars():
+    assert clean_text("  a\xa0b​c  \n\t d ") == "a bc d"
+    assert clean_text(None) == ""
+
+
+def test_extract_flat_text_skips_noise_tags():
+    tree = LexborHTMLParser(
+        "<body><nav>Menú</nav><p>Hola<br>mundo</p><script>x()</script><!-- c --><footer>Pie</footer></body>"
+    )
+
+    assert extract_flat_text(tree.body) == "Hola mundo"
+
+
+def test_extract_flat_text_handles_deeply_nested_html():
+    depth = 1200
+    for html in ("<font>" * depth + "profundo", "<div>" * depth + "profundo" + "</div>" * depth):
+        tree = LexborHTMLParser(f"<html><body>{html}</body></html>")
+
+        assert extract_flat_text(tree.body) == "profundo"
+        assert node_text(tree.body) == "profundo"
@@ -0,0 +1,95 @@
+import threading
+import time
+
+import pytest
+import requests
+from selectolax.lexbor import LexborHTMLParser
+
+from schema_automation.extraction import extract_flat_text
+from schema_automation.infrastructure import http
+from schema_automation.service import workflow
+from schema_automation.service.workflow import _select_body_node
+
+
+def test_select_body_node_ignores_script_only_candidates():
+    tree = LexborHTMLParser(
+        "<html><body><main><script>var a = 1;</script><style>p{}</style></main>"
+        "<div>body text</div></body></html>"
+    )
+
+    node = _select_body_node(tree)
+
+    assert node is not None and node.tag == "body"
+    assert extract_flat_text(node) == "body text"
+
+
+def test_select_body_node_counts_noscript_text_like_baseline():
+    tree = LexborHTMLParser("<html><body><main><noscript>Activá JavaScript</noscript></main></body></html>")
+
+    node = _select_body_node(tree)
+
+    assert node is not None and node.tag == "main"
+
+
+def test_select_body_node_prefers_article_with_text():
+    tree = LexborHTMLParser("<body><article><p>Artículo</p></article><main>Main</main></body>")
+
+    assert _select_body_node(tree).tag == "article"
+
+
+def test_select_body_node_returns_none_for_empty_page():
+    tree = LexborHTMLParser("<html><body><script>x()</script></body></html>")
+
+    assert _select_body_node(tree) is None
+
+
+def _fake_fetch(url, **kwargs):
+    if "rota" in url:
+        raise requests.HTTPError(f"404 para {url}")
+    # Las primeras URLs tardan más: el orden de salida no depende de cuál termina antes.
+    time.sleep(0.05 if url.endswith("/1") else 0)
+    return f"<html><head><title>{url}</title></head><body><p>{url}</p></body></html>", url, url
+
+
+def test_build_schemas_from_urls_keeps_job_order(monkeypatch):
+    monkeypatch.setattr(workflow, "fetch_html", _fake_fetch)
+    jobs = [(f"https://e.com/{i}", f"Producto {i}", "payment_card") for i in range(1, 5)]
+
+    records = workflow.build_schemas_from_urls(jobs, max_workers=4)
+
+    assert [record.url for record in records] == [url for url, _, _ in jobs]
+    assert [record.name for record in records] == [nombre for _, nombre, _ in jobs]
+    assert records[0].extracted.body_text == "https://e.com/1"
+
+
+def test_build_schemas_from_urls_handles_empty_jobs_and_invalid_workers():
+    assert workflow.build_schemas_from_urls([]) == []
+    with pytest.raises(ValueError, match="max_workers"):
+        workflow.build_schemas_from_urls([("https://e.com/1", "n", "payment_card")], max_workers=0)
+
+
+def test_build_schemas_from_urls_error_path(monkeypatch):
+    monkeypatch.setattr(workflow, "fetch_html", _fake_fetch)
+    jobs = [
+        ("https://e.com/1", "Uno", "payment_card"),
+        ("https://e.com/rota", "Rota", "payment_card"),
+        ("https://e.com/3", "Tres", "payment_card"),
+    ]
+
+    with pytest.raises(requests.HTTPError):
+        workflow.build_schemas_from_urls(jobs)
+
+    results = workflow.build_schemas_from_urls(jobs, return_exceptions=True)
+    assert results[0].url == "https://e.com/1"
+    assert isinstance(results[1], requests.HTTPError)
+    assert results[2].url == "https://e.com/3"
+
+
+def test_http_sessions_are_per_thread():
+    sessions = []
+    worker = threading.Thread(target=lambda: sessions.append(http._session()))
+    worker.start()
+    worker.join()
+
+    assert http._session() is http._session()
+    assert sessions[0] is not http._session()